@@ -10,6 +10,10 @@ import sys
 
 def configure_paths() -> None:
     """Configure paths for frozen application."""
+    # Runs once per process; setup_environment_paths() checks the same flag
+    if getattr(sys, '_vd_hook_done', False):
+        return
+
     if getattr(sys, 'frozen', False):
         # Running as compiled executable
         base_path = sys._MEIPASS
@@ -19,10 +23,11 @@ def configure_paths() -> None:
         current_path = os.environ.get('PATH', '')
         os.environ['PATH'] = bin_path + os.pathsep + current_path
 
-        # Set explicit FFmpeg location for yt-dlp
-        ffmpeg_exe = os.path.join(bin_path, 'ffmpeg.exe')
-        if os.path.exists(ffmpeg_exe):
-            os.environ['FFMPEG_BINARY'] = ffmpeg_exe
+        # Set explicit FFmpeg location for yt-dlp. The bundle layout is fixed
+        # at build time (app.spec), so skip the stat; consumers fall back if absent.
+        os.environ['FFMPEG_BINARY'] = os.path.join(bin_path, 'ffmpeg.exe')
+
+        sys._vd_hook_done = True
 
 
 # Run configuration on import
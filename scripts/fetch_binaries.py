@@ -8,10 +8,13 @@ video downloader to function properly. It extracts only the required executables
 and places them in the bin/ directory.
 """
 
-import io
+import shutil
 import sys
+import tempfile
+import threading
 import zipfile
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Configuration
@@ -20,35 +23,82 @@ BIN_DIR = Path(__file__).parent.parent / "bin"
 # FFmpeg from BtbN's builds (GPL licensed, includes all codecs)
 FFMPEG_URL = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip"
 
+# Chunk size for streaming downloads and archive extraction
+CHUNK_SIZE = 1 << 20
+
 # Deno runtime for YouTube JS execution
 # Last updated: 2026-03-28 (Deno v2.7.9)
 DENO_URL = "https://github.com/denoland/deno/releases/download/v2.7.9/deno-x86_64-pc-windows-msvc.zip"
 
 
+HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+
+# Downloads run concurrently; keep their output lines from interleaving
+_print_lock = threading.Lock()
+
+
+def log(message: str) -> None:
+    """Print a line of progress output (thread-safe)."""
+    with _print_lock:
+        print(message)
+
+
+def get_remote_etag(url: str) -> str | None:
+    """Fetch the ETag of a remote archive with a HEAD request (None if unavailable)."""
+    req = urllib.request.Request(url, headers=HEADERS, method="HEAD")
+    try:
+        with urllib.request.urlopen(req, timeout=30) as response:
+            return response.headers.get("ETag")
+    except Exception:
+        return None
+
+
 def download_and_extract(url: str, target_files: list[str]) -> None:
-    """Download ZIP and extract specific files to bin directory."""
-    print(f"Downloading {url}...")
+    """Download ZIP and extract specific files to bin directory.
+
+    Skips the download when all target files exist and the remote ETag
+    matches the one recorded after the previous extraction.
+    """
+    etag_file = BIN_DIR / f".{Path(target_files[0]).stem}.etag"
+    etag = get_remote_etag(url)
+
+    if (
+        etag
+        and etag_file.exists()
+        and etag_file.read_text(encoding="utf-8").strip() == etag
+        and all((BIN_DIR / name).exists() for name in target_files)
+    ):
+        log(f"Up to date: {', '.join(target_files)}")
+        return
 
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
-    req = urllib.request.Request(url, headers=headers)
+    log(f"Downloading {url}...")
+
+    req = urllib.request.Request(url, headers=HEADERS)
 
     try:
-        with urllib.request.urlopen(req, timeout=120) as response:
-            data = response.read()
-            print(f"  Downloaded {len(data) / (1024*1024):.1f} MB")
+        # Spool the archive to disk instead of holding it in memory
+        with urllib.request.urlopen(req, timeout=120) as response, tempfile.TemporaryFile() as tf:
+            shutil.copyfileobj(response, tf, length=CHUNK_SIZE)
+            log(f"  Downloaded {url.rsplit('/', 1)[-1]} ({tf.tell() / (1024*1024):.1f} MB)")
+            tf.seek(0)
 
-            with zipfile.ZipFile(io.BytesIO(data)) as z:
+            with zipfile.ZipFile(tf) as z:
                 for file_info in z.infolist():
                     # Extract only the files we need (flatten directory structure)
                     if file_info.filename.endswith(tuple(target_files)):
                         filename = Path(file_info.filename).name
-                        print(f"  Extracting {filename}...")
+                        log(f"  Extracting {filename}...")
                         target_path = BIN_DIR / filename
                         with z.open(file_info) as source:
                             with open(target_path, "wb") as target:
-                                target.write(source.read())
+                                shutil.copyfileobj(source, target, length=CHUNK_SIZE)
+
+            # Remember which archive these files came from
+            etag = response.headers.get("ETag") or etag
+            if etag:
+                etag_file.write_text(etag, encoding="utf-8")
     except Exception as e:
-        print(f"  Error: {e}")
+        log(f"  Error: {e}")
         raise
 
 
@@ -58,11 +108,14 @@ def main() -> int:
     BIN_DIR.mkdir(exist_ok=True)
 
     try:
-        # Download FFmpeg (includes ffmpeg.exe and ffprobe.exe)
-        download_and_extract(FFMPEG_URL, ["ffmpeg.exe", "ffprobe.exe"])
-
-        # Download Deno
-        download_and_extract(DENO_URL, ["deno.exe"])
+        # Download FFmpeg (includes ffmpeg.exe and ffprobe.exe) and Deno in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(download_and_extract, FFMPEG_URL, ["ffmpeg.exe", "ffprobe.exe"]),
+                executor.submit(download_and_extract, DENO_URL, ["deno.exe"]),
+            ]
+            for future in futures:
+                future.result()
 
         print(f"\nBinaries ready in {BIN_DIR}")
         print("\nInstalled files:")
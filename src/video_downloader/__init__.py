@@ -9,26 +9,66 @@ __version__ = "2.2.0"
 __author__ = "Pawel Zawadzki"
 __license__ = "MIT"
 
-# Expose main API
-from video_downloader.core import (
-    RuntimeManager,
-    ThreadedDownloadManager,
-    VideoDownloader,
-)
-from video_downloader.gui import DiagnosticsPane, MainWindow, main
-from video_downloader.utils import (
-    AppConfig,
-    ConfigurationError,
-    DownloadConfig,
-    DownloadError,
-    FFmpegManager,
-    NetworkError,
-    PathValidator,
-    RuntimeNotFoundError,
-    URLValidator,
-    ValidationError,
-    VideoDownloaderError,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from video_downloader.core import (
+        RuntimeManager,
+        ThreadedDownloadManager,
+        VideoDownloader,
+    )
+    from video_downloader.gui import DiagnosticsPane, MainWindow, main
+    from video_downloader.utils import (
+        AppConfig,
+        ConfigurationError,
+        DownloadConfig,
+        DownloadError,
+        FFmpegManager,
+        NetworkError,
+        PathValidator,
+        RuntimeNotFoundError,
+        URLValidator,
+        ValidationError,
+        VideoDownloaderError,
+    )
+
+# Expose main API lazily (PEP 562) so importing the package, or running the
+# CLI, does not pull in CustomTkinter/Tk or yt-dlp until actually needed
+_LAZY_ATTRS: dict[str, str] = {
+    # Core
+    "VideoDownloader": "video_downloader.core",
+    "RuntimeManager": "video_downloader.core",
+    "ThreadedDownloadManager": "video_downloader.core",
+    # GUI
+    "MainWindow": "video_downloader.gui",
+    "DiagnosticsPane": "video_downloader.gui",
+    "main": "video_downloader.gui",
+    # Utils
+    "AppConfig": "video_downloader.utils",
+    "DownloadConfig": "video_downloader.utils",
+    "FFmpegManager": "video_downloader.utils",
+    "URLValidator": "video_downloader.utils",
+    "PathValidator": "video_downloader.utils",
+    # Exceptions
+    "VideoDownloaderError": "video_downloader.utils",
+    "NetworkError": "video_downloader.utils",
+    "DownloadError": "video_downloader.utils",
+    "ValidationError": "video_downloader.utils",
+    "ConfigurationError": "video_downloader.utils",
+    "RuntimeNotFoundError": "video_downloader.utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public API objects on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Core
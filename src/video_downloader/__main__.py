@@ -9,15 +9,17 @@ Usage:
 import sys
 
 if __name__ == "__main__":
-    # Check if CLI mode is requested
-    if len(sys.argv) > 1 and sys.argv[1] == "cli":
-        # Remove 'cli' argument and run CLI
-        sys.argv.pop(1)
-        from video_downloader.cli import cli_main
+    mode = sys.argv[1] if len(sys.argv) > 1 else None
+
+    # Import only the selected front end: the CLI never loads Tk and the GUI
+    # never loads Typer/Rich
+    if mode == "cli":
+        # Drop the 'cli' selector so Typer sees only its own arguments
+        del sys.argv[1]
+        from video_downloader.cli_entry import main as cli_main
 
         cli_main()
     else:
-        # Run GUI
         from video_downloader.gui import main
 
         main()
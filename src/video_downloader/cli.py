@@ -5,42 +5,26 @@ Provides Typer-based CLI for downloading videos from the terminal.
 """
 
 import logging
-import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    Progress,
-    TaskID,
-    TextColumn,
-    TimeElapsedColumn,
-)
 
-from video_downloader.core.downloader import VideoDownloader
-from video_downloader.core.runtime_manager import RuntimeManager
-from video_downloader.utils.config import AppConfig, DownloadConfig
-from video_downloader.utils.exceptions import (
-    ConfigurationError,
-    DownloadError,
-    NetworkError,
-    RuntimeNotFoundError,
-    ValidationError,
-)
-from video_downloader.utils.ffmpeg_manager import FFmpegManager
-from video_downloader.utils.validators import URLValidator
+from video_downloader.cli_entry import check_deps as _check_deps
+from video_downloader.cli_entry import get_console as _get_console
+
+if TYPE_CHECKING:
+    from rich.progress import TaskID
 
-# Configure logging for CLI
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-logger = logging.getLogger(__name__)
+# Heavy imports (Rich, yt-dlp via the downloader stack) are deferred into the
+# command bodies so that --help and `version` stay fast.
 
 app = typer.Typer(
     name="video-downloader",
     help="Download videos from YouTube, Vimeo, and other platforms",
     add_completion=False,
 )
-console = Console()
 
 
 @app.command()
@@ -56,6 +40,9 @@ def download(
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Verbose output with debug information"
     ),
+    rich_traceback: bool = typer.Option(
+        False, "--rich-traceback", hidden=True, help="Render verbose tracebacks with Rich"
+    ),
 ):
     """
     Download a video from URL.
@@ -67,6 +54,32 @@ def download(
 
         video-downloader download "https://..." --audio-only
     """
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    from video_downloader.core.downloader import VideoDownloader, resolve_output
+    from video_downloader.core.runtime_manager import get_runtime_manager
+    from video_downloader.utils.config import (
+        AppConfig,
+        DownloadConfig,
+        get_default_max_concurrent,
+    )
+    from video_downloader.utils.constants import PROGRESS_UPDATE_INTERVAL
+    from video_downloader.utils.exceptions import (
+        ConfigurationError,
+        DownloadError,
+        NetworkError,
+        RuntimeNotFoundError,
+        ValidationError,
+    )
+    from video_downloader.utils.validators import URLValidator
+
+    console = _get_console()
+
     # Set log level
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -83,7 +96,7 @@ def download(
                 version="2.2.0",
                 download=DownloadConfig(
                     output_dir=Path("downloads"),
-                    max_concurrent=3,
+                    max_concurrent=get_default_max_concurrent(),
                     timeout=300,
                     retry_attempts=3,
                     quality=quality,
@@ -104,29 +117,22 @@ def download(
 
     # Initialize runtime manager
     try:
-        runtime_manager = RuntimeManager()
+        runtime_manager = get_runtime_manager()
         console.print(f"[green]✓[/green] Deno runtime: {runtime_manager.deno_path}")
     except RuntimeNotFoundError as e:
         console.print(f"[red]✗ {e}[/red]")
         raise typer.Exit(1) from None
 
-    # Check FFmpeg
-    try:
-        ffmpeg_manager = FFmpegManager()
-        success, version_str, _ = ffmpeg_manager.check_version()
-        if success:
-            console.print(f"[green]✓[/green] FFmpeg: {version_str}")
-        else:
-            console.print("[yellow]⚠[/yellow] FFmpeg version check failed")
-    except RuntimeNotFoundError:
+    # Check FFmpeg (already probed while initializing the runtime manager)
+    if not runtime_manager.is_ffmpeg_available():
         console.print("[yellow]⚠[/yellow] FFmpeg not found (may affect some downloads)")
-
-    # Determine output path
-    if output is None:
-        output = config.download.output_dir
-        output.mkdir(parents=True, exist_ok=True)
+    elif ffmpeg_version := runtime_manager.get_ffmpeg_version():
+        console.print(f"[green]✓[/green] FFmpeg: {ffmpeg_version}")
     else:
-        output.parent.mkdir(parents=True, exist_ok=True)
+        console.print("[yellow]⚠[/yellow] FFmpeg version check failed")
+
+    # Determine output directory
+    output = resolve_output(config, output)
 
     # Create downloader
     downloader = VideoDownloader(runtime_manager, config)
@@ -135,40 +141,42 @@ def download(
     console.print(f"\n[cyan]Downloading to: {output}[/cyan]\n")
 
     with Progress(
-        TextColumn("[progress.description]{task.description}"),
+        # Styles are set on the columns and markup parsing is off, so Rich
+        # does not re-parse [style] tags on every redraw
+        TextColumn("{task.description}", style="progress.description", markup=False),
         BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TextColumn("•"),
-        TextColumn("[cyan]{task.fields[speed]}[/cyan]"),
-        TextColumn("•"),
-        TextColumn("ETA: {task.fields[eta]}"),
+        TextColumn("{task.percentage:>3.0f}%", style="progress.percentage", markup=False),
+        TextColumn("•", markup=False),
+        TextColumn("{task.fields[speed]}", style="cyan", markup=False),
+        TextColumn("•", markup=False),
+        TextColumn("ETA: {task.fields[eta]}", markup=False),
         TimeElapsedColumn(),
         console=console,
     ) as progress:
         task: TaskID | None = None
+        last_render = 0.0
+        last_pct = -1.0
 
         def progress_callback(info: dict) -> None:
-            nonlocal task
+            nonlocal task, last_render, last_pct
 
             if info["status"] == "downloading":
+                speed = info.get("speed", "N/A")
+                eta = info.get("eta", "N/A")
+
                 if task is None:
-                    task = progress.add_task(
-                        "Downloading...",
-                        total=100,
-                        speed=info.get("speed", "N/A"),
-                        eta=info.get("eta", "N/A"),
-                    )
-
-                try:
-                    pct = float(info["percentage"].strip("%"))
-                    progress.update(
-                        task,
-                        completed=pct,
-                        speed=info.get("speed", "N/A"),
-                        eta=info.get("eta", "N/A"),
-                    )
-                except ValueError:
-                    pass
+                    task = progress.add_task("Downloading...", total=100, speed=speed, eta=eta)
+
+                pct = info.get("fraction", 0.0) * 100.0
+
+                # yt-dlp can report far faster than a terminal needs; cap at ~10 Hz
+                now = time.monotonic()
+                if now - last_render < PROGRESS_UPDATE_INTERVAL and abs(pct - last_pct) < 1.0:
+                    return
+                last_render = now
+                last_pct = pct
+
+                progress.update(task, completed=pct, speed=speed, eta=eta)
 
             elif info["status"] == "complete":
                 if task is not None:
@@ -204,34 +212,19 @@ def download(
         except Exception as e:
             console.print(f"\n[red]✗ Unexpected error: {e}[/red]")
             if verbose:
-                console.print_exception()
+                if rich_traceback:
+                    console.print_exception()
+                else:
+                    import traceback
+
+                    traceback.print_exc()
             raise typer.Exit(1) from None
 
 
 @app.command()
-def check_deps():
+def check_deps() -> None:
     """Check runtime dependencies (Deno, FFmpeg)."""
-    console.print("\n[bold]Checking dependencies...[/bold]\n")
-
-    # Check Deno
-    try:
-        runtime_manager = RuntimeManager()
-        console.print(f"[green]✓ Deno[/green]: {runtime_manager.deno_path}")
-    except RuntimeNotFoundError as e:
-        console.print(f"[red]✗ Deno[/red]: {e}")
-
-    # Check FFmpeg
-    try:
-        ffmpeg_manager = FFmpegManager()
-        success, version_str, version = ffmpeg_manager.check_version()
-        if success:
-            console.print(f"[green]✓ FFmpeg[/green]: {version_str}")
-        else:
-            console.print(f"[yellow]⚠ FFmpeg[/yellow]: Version check failed - {version_str}")
-    except RuntimeNotFoundError as e:
-        console.print(f"[red]✗ FFmpeg[/red]: {e}")
-
-    console.print()
+    _check_deps()
 
 
 @app.command()
@@ -239,16 +232,14 @@ def version():
     """Show version information."""
     from video_downloader import __version__
 
-    console.print(f"Video Downloader v{__version__}")
+    _get_console().print(f"Video Downloader v{__version__}")
 
 
-def cli_main():
-    """Entry point for CLI."""
-    try:
-        app()
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Interrupted by user[/yellow]")
-        sys.exit(130)
+def cli_main() -> None:
+    """Entry point for CLI (kept for callers of the old console-script target)."""
+    from video_downloader.cli_entry import main
+
+    main()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+"""
+Console-script entry point for the CLI.
+
+Handles the trivial `version` and `check-deps` invocations without importing
+Typer/Click; everything else is handed to the Typer app in video_downloader.cli.
+"""
+
+import logging
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Return the shared Rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def check_deps() -> None:
+    """Check runtime dependencies (Deno, FFmpeg)."""
+    from video_downloader.core.runtime_manager import get_runtime_manager
+    from video_downloader.utils.exceptions import RuntimeNotFoundError
+    from video_downloader.utils.ffmpeg_manager import get_ffmpeg_manager
+
+    console = get_console()
+    console.print("\n[bold]Checking dependencies...[/bold]\n")
+
+    # Check Deno
+    try:
+        runtime_manager = get_runtime_manager()
+        console.print(f"[green]✓ Deno[/green]: {runtime_manager.deno_path}")
+    except RuntimeNotFoundError as e:
+        console.print(f"[red]✗ Deno[/red]: {e}")
+
+    # Check FFmpeg
+    try:
+        ffmpeg_manager = get_ffmpeg_manager()
+        success, version_str, version = ffmpeg_manager.check_version()
+        if success:
+            console.print(f"[green]✓ FFmpeg[/green]: {version_str}")
+        else:
+            console.print(f"[yellow]⚠ FFmpeg[/yellow]: Version check failed - {version_str}")
+    except RuntimeNotFoundError as e:
+        console.print(f"[red]✗ FFmpeg[/red]: {e}")
+
+    console.print()
+
+
+def main() -> None:
+    """Entry point for CLI."""
+    # Fast path: bare `version` needs neither Typer/Click nor Rich
+    args = sys.argv[1:]
+    if args == ["version"]:
+        from video_downloader import __version__
+
+        print(f"Video Downloader v{__version__}")
+        return
+
+    # Configure logging for CLI; pick the level up front so records emitted
+    # before the command body runs are not filtered at the wrong level
+    verbose = "-v" in sys.argv or "--verbose" in sys.argv
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+    try:
+        if args == ["check-deps"]:
+            check_deps()
+        else:
+            # Only now pay for Typer/Click and the command declarations
+            from video_downloader.cli import app
+
+            app()
+    except KeyboardInterrupt:
+        get_console().print("\n[yellow]Interrupted by user[/yellow]")
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,12 @@ from video_downloader.core.playlist_manager import (
     PlaylistItem,
     PlaylistManager,
 )
-from video_downloader.core.runtime_manager import RuntimeManager
+from video_downloader.core.runtime_manager import RuntimeManager, get_runtime_manager
 
 __all__ = [
     "VideoDownloader",
     "RuntimeManager",
+    "get_runtime_manager",
     "ThreadedDownloadManager",
     "PlaylistManager",
     "PlaylistInfo",
@@ -1,21 +1,23 @@
 """
 Threaded download manager for GUI integration.
 
-Manages downloads in background threads with queue-based communication.
+Manages downloads in background threads with deque-based communication.
 """
 
 import logging
-import queue
 import threading
+import time
 import uuid
+from collections import deque
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from video_downloader.core.downloader import VideoDownloader
+from video_downloader.core.downloader import VideoDownloader, resolve_output
 from video_downloader.core.runtime_manager import RuntimeManager
 from video_downloader.utils.config import AppConfig
+from video_downloader.utils.constants import PROGRESS_UPDATE_INTERVAL
 from video_downloader.utils.exceptions import DownloadError, NetworkError, ValidationError
 from video_downloader.utils.validators import URLValidator
 
@@ -26,7 +28,8 @@ class ThreadedDownloadManager:
     """
     Manages downloads in background threads with GUI callbacks.
 
-    Uses queue-based communication for thread-safe GUI updates.
+    Worker threads append events to a deque (atomic under the GIL) and the
+    GUI thread collects them in batches with drain().
     """
 
     def __init__(
@@ -46,11 +49,19 @@ class ThreadedDownloadManager:
         self.runtime_manager = runtime_manager
         self.config = config
         self.update_callback = update_callback
-        self.message_queue: queue.Queue[tuple[str, Any]] = queue.Queue()
+        self.message_queue: deque[tuple[str, Any]] = deque()
+        self._msg_event = threading.Event()
+        # Progress ticks are held back and published at most every
+        # PROGRESS_UPDATE_INTERVAL; other events flush the held tick first
+        self._progress_lock = threading.Lock()
+        self._pending_progress: tuple[str, Any] | None = None
+        self._last_progress_signal = 0.0
         self.executor = ThreadPoolExecutor(
             max_workers=config.download.max_concurrent, thread_name_prefix="dl"
         )
         self._active: dict[str, VideoDownloader] = {}
+        # Submitted downloads that have not finished yet (queued or running)
+        self._pending = 0
         self._lock = threading.Lock()
         self._last_completed_file: Path | None = None
         self.shutdown_event = threading.Event()
@@ -75,6 +86,9 @@ class ThreadedDownloadManager:
             task_id: UUID string for tracking this download
         """
         task_id = uuid.uuid4().hex
+        logger.debug(f"Queueing download {task_id} for {url}")
+        with self._lock:
+            self._pending += 1
         self.executor.submit(
             self._download_worker, task_id, url, output_path, quality, audio_only
         )
@@ -108,8 +122,8 @@ class ThreadedDownloadManager:
                 self._send_update("error", str(e))
                 return
 
-            # Ensure output directory exists
-            output_path.mkdir(parents=True, exist_ok=True)
+            # Ensure output directory exists (parent, if a file path was given)
+            output_path = resolve_output(self.config, output_path)
 
             # Create downloader
             downloader = VideoDownloader(self.runtime_manager, self.config)
@@ -150,25 +164,97 @@ class ThreadedDownloadManager:
         finally:
             with self._lock:
                 self._active.pop(task_id, None)
+                self._pending -= 1
             if downloader and downloader.last_downloaded_file:
                 with self._lock:
                     self._last_completed_file = downloader.last_downloaded_file
 
     def _send_update(self, event_type: str, data: Any) -> None:
         """
-        Send update to GUI thread via queue.
+        Send update to GUI thread via the message deque.
 
         Args:
             event_type: Type of event (status, progress, complete, error)
             data: Event data
         """
-        self.message_queue.put((event_type, data))
+        with self._progress_lock:
+            if event_type == "progress":
+                now = time.monotonic()
+                if now - self._last_progress_signal < PROGRESS_UPDATE_INTERVAL:
+                    self._pending_progress = (event_type, data)
+                    return
+                self._last_progress_signal = now
+                self._pending_progress = None
+            elif self._pending_progress is not None:
+                self.message_queue.append(self._pending_progress)
+                self._pending_progress = None
+
+            self.message_queue.append((event_type, data))
+        self._msg_event.set()
+
+    def is_busy(self) -> bool:
+        """
+        Check whether the GUI should keep polling at the fast rate.
+
+        Returns:
+            True while downloads are queued or running, or events are waiting
+        """
+        return self._pending > 0 or self._msg_event.is_set()
+
+    def drain(self) -> list[tuple[str, Any]]:
+        """
+        Collect all pending events for the GUI thread.
+
+        Runs of consecutive progress events are coalesced into the latest one,
+        since only the most recent progress state is worth rendering. A
+        throttled progress tick is released here once PROGRESS_UPDATE_INTERVAL
+        has passed, so it is not held back when yt-dlp goes quiet (e.g. while
+        merging or post-processing).
+
+        Returns:
+            List of (event_type, data) tuples in arrival order
+        """
+        if self._pending_progress is not None:
+            self._flush_stale_progress()
+        if not self._msg_event.is_set():
+            return []
+        # Clear before popping so an append racing with us re-sets the flag
+        self._msg_event.clear()
+
+        items: list[tuple[str, Any]] = []
+        popleft = self.message_queue.popleft
+        while True:
+            try:
+                item = popleft()
+            except IndexError:
+                break
+            if item[0] == "progress" and items and items[-1][0] == "progress":
+                items[-1] = item
+            else:
+                items.append(item)
+        return items
+
+    def _flush_stale_progress(self) -> None:
+        """Publish a held progress tick if the throttle interval has elapsed."""
+        with self._progress_lock:
+            if self._pending_progress is None:
+                return
+            now = time.monotonic()
+            if now - self._last_progress_signal < PROGRESS_UPDATE_INTERVAL:
+                return
+            self.message_queue.append(self._pending_progress)
+            self._pending_progress = None
+            self._last_progress_signal = now
+        self._msg_event.set()
 
     def cancel_current(self) -> None:
         """Cancel all active downloads."""
+        # Snapshot under the lock, cancel outside it so workers finishing
+        # concurrently are never blocked behind cancel() calls
         with self._lock:
-            for downloader in self._active.values():
-                downloader.cancel()
+            active = list(self._active.values())
+        for downloader in active:
+            downloader.cancel()
 
     def shutdown(self) -> None:
         """
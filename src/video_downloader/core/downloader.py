@@ -4,12 +4,17 @@ Core video downloader using yt-dlp.
 Provides video downloading functionality with progress callbacks and error handling.
 """
 
+import copy
+import csv
 import logging
 import os
 import random
+import re
 import subprocess
+import threading
 import time
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -24,10 +29,163 @@ from video_downloader.utils.constants import (
     get_random_user_agent,
 )
 from video_downloader.utils.exceptions import DownloadError, NetworkError
+from video_downloader.utils.path_utils import ensure_dir, forget_dir
 from video_downloader.utils.validators import is_mix_playlist
 
 logger = logging.getLogger(__name__)
 
+_HOME = Path.home()
+
+
+def _parse_tasklist(stdout: str) -> frozenset[str]:
+    """Parse ``tasklist /FO CSV /NH`` output into lowercased image names."""
+    return frozenset(row[0].lower() for row in csv.reader(stdout.splitlines()) if row)
+
+
+def _parse_ps(stdout: str) -> frozenset[str]:
+    """Parse ``ps -eo comm=`` output into lowercased executable basenames."""
+    # macOS reports full executable paths; keep the basename
+    return frozenset(
+        line.strip().rpartition("/")[2].lower() for line in stdout.splitlines() if line.strip()
+    )
+
+
+# Process-listing command for this OS, chosen once: (argv, extra run kwargs, parser)
+_PROCESS_LISTER: tuple[list[str], dict[str, Any], Callable[[str], frozenset[str]]] = (
+    (
+        ["tasklist", "/FO", "CSV", "/NH"],
+        {"creationflags": subprocess.CREATE_NO_WINDOW},
+        _parse_tasklist,
+    )
+    if os.name == "nt"
+    else (["ps", "-eo", "comm="], {}, _parse_ps)
+)
+
+
+def _keyword_re(*keywords: str) -> re.Pattern[str]:
+    """Compile keywords into one alternation for a single C-level scan."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Error classification, checked in order: (is_recoverable, category, pattern)
+_ERROR_CLASSES: tuple[tuple[bool, str, re.Pattern[str]], ...] = (
+    # Fatal errors - don't retry
+    (False, "video_unavailable", _keyword_re("unavailable", "private", "deleted", "removed")),
+    (False, "geo_blocked", _keyword_re("copyright", "blocked", "not available in your country")),
+    (False, "drm_protected", _keyword_re("drm", "protected")),
+    # Recoverable errors - retry with different strategy
+    (True, "forbidden", _keyword_re("403", "forbidden")),
+    (True, "bot_detection", _keyword_re("bot", "sign in", "confirm you")),
+    (True, "rate_limited", _keyword_re("429", "too many", "rate limit")),
+    (True, "network", _keyword_re("timeout", "timed out", "connection")),
+)
+
+
+def resolve_output(config: AppConfig, output: Path | None = None) -> Path:
+    """
+    Resolve the directory a download should be written into and ensure it exists.
+
+    yt-dlp chooses the filename itself, so a path with a suffix (e.g.
+    ``video.mp4``) is treated as a file inside its parent directory rather
+    than created as a directory.
+
+    Args:
+        config: Application configuration (supplies the default directory)
+        output: User-supplied output path, or None for the configured default
+
+    Returns:
+        Existing output directory
+    """
+    path = output if output is not None else config.download.output_dir
+    return ensure_dir(path.parent if path.suffix else path)
+
+
+@lru_cache(maxsize=16)
+def _output_template(output_dir: Path) -> str:
+    """Build the yt-dlp output template for a directory; cached per directory."""
+    # Always use %(ext)s - yt-dlp handles extension changes from postprocessors
+    # This prevents double extensions like .flac.flac when ExtractAudio runs
+    return str(output_dir / "%(title).100s_%(id)s.%(ext)s")
+
+
+@lru_cache(maxsize=32)
+def _format_config_template(quality_lower: str, audio_only: bool) -> dict[str, Any]:
+    """
+    Build the yt-dlp format configuration for a quality preset.
+
+    Results are cached and shared; use VideoDownloader._get_format_config,
+    which returns a private copy.
+
+    Args:
+        quality_lower: Lowercased quality preset or audio format
+        audio_only: Force audio-only download
+
+    Returns:
+        Dictionary with format, postprocessors, and merge settings
+    """
+    config: dict[str, Any] = {
+        "format": "bestvideo+bestaudio/best",
+        "postprocessors": [],
+        "merge_output_format": "mkv",
+    }
+
+    # Native quality: no re-encoding, no postprocessors
+    if quality_lower == "native":
+        return {
+            "format": "bestvideo+bestaudio/best",
+            "merge_output_format": "mkv",
+            "postprocessors": [],
+        }
+
+    # Check if audio format requested
+    if audio_only or quality_lower in AUDIO_FORMATS:
+        audio_config = AUDIO_FORMATS.get(quality_lower, AUDIO_FORMATS["mp3"])
+
+        config["format"] = "bestaudio/best"
+        config["merge_output_format"] = None  # No video merge
+        config["postprocessors"] = [
+            {
+                "key": "FFmpegExtractAudio",
+                "preferredcodec": audio_config["codec"],
+                "preferredquality": audio_config["quality"],
+            }
+        ]
+
+        # Add metadata
+        config["postprocessors"].append(
+            {
+                "key": "FFmpegMetadata",
+                "add_metadata": True,
+            }
+        )
+
+        # Embed thumbnail only for formats that support it
+        # Supported: mp3, mkv/mka, ogg/opus/flac, m4a/mp4/m4v/mov
+        # NOT supported: wav
+        thumbnail_supported_codecs = {"mp3", "opus", "flac", "aac", "m4a"}
+        if audio_config["codec"] in thumbnail_supported_codecs:
+            config["postprocessors"].append(
+                {
+                    "key": "EmbedThumbnail",
+                }
+            )
+            config["writethumbnail"] = True
+
+    else:
+        # Video quality
+        config["format"] = VIDEO_QUALITIES.get(quality_lower, VIDEO_QUALITIES["best"])
+        config["merge_output_format"] = "mkv"
+
+        # Add metadata to video
+        config["postprocessors"].append(
+            {
+                "key": "FFmpegMetadata",
+                "add_metadata": True,
+            }
+        )
+
+    return config
+
 
 class VideoDownloader:
     """
@@ -50,37 +208,33 @@ class VideoDownloader:
     )
 
     # Browser profile paths for existence checking (Windows + Linux)
-    BROWSER_PROFILE_PATHS: dict[str, list[Path]] = {
-        "firefox": [
-            Path.home() / "AppData/Roaming/Mozilla/Firefox/Profiles",
-            Path.home() / ".mozilla/firefox",
-        ],
-        "chrome": [
-            Path.home() / "AppData/Local/Google/Chrome/User Data",
-            Path.home() / ".config/google-chrome",
-        ],
-        "edge": [
-            Path.home() / "AppData/Local/Microsoft/Edge/User Data",
-        ],
-        "brave": [
-            Path.home() / "AppData/Local/BraveSoftware/Brave-Browser/User Data",
-            Path.home() / ".config/BraveSoftware/Brave-Browser",
-        ],
-        "opera": [
-            Path.home() / "AppData/Roaming/Opera Software/Opera Stable",
-            Path.home() / ".config/opera",
-        ],
-        "vivaldi": [
-            Path.home() / "AppData/Local/Vivaldi/User Data",
-            Path.home() / ".config/vivaldi",
-        ],
-        "chromium": [
-            Path.home() / "AppData/Local/Chromium/User Data",
-            Path.home() / ".config/chromium",
-        ],
-        "whale": [
-            Path.home() / "AppData/Local/Naver/Naver Whale/User Data",
-        ],
+    BROWSER_PROFILE_PATHS: dict[str, tuple[Path, ...]] = {
+        "firefox": (
+            _HOME / "AppData/Roaming/Mozilla/Firefox/Profiles",
+            _HOME / ".mozilla/firefox",
+        ),
+        "chrome": (
+            _HOME / "AppData/Local/Google/Chrome/User Data",
+            _HOME / ".config/google-chrome",
+        ),
+        "edge": (_HOME / "AppData/Local/Microsoft/Edge/User Data",),
+        "brave": (
+            _HOME / "AppData/Local/BraveSoftware/Brave-Browser/User Data",
+            _HOME / ".config/BraveSoftware/Brave-Browser",
+        ),
+        "opera": (
+            _HOME / "AppData/Roaming/Opera Software/Opera Stable",
+            _HOME / ".config/opera",
+        ),
+        "vivaldi": (
+            _HOME / "AppData/Local/Vivaldi/User Data",
+            _HOME / ".config/vivaldi",
+        ),
+        "chromium": (
+            _HOME / "AppData/Local/Chromium/User Data",
+            _HOME / ".config/chromium",
+        ),
+        "whale": (_HOME / "AppData/Local/Naver/Naver Whale/User Data",),
     }
 
     # Browser process names for running detection (Windows)
@@ -94,20 +248,89 @@ class VideoDownloader:
         "whale": "whale.exe",
     }
 
-    def __init__(self, runtime_manager: RuntimeManager, config: AppConfig) -> None:
+    # Browsers with a profile directory, detected once (see _detect_installed_browsers)
+    _installed_browsers: frozenset[str] | None = None
+
+    # Seconds a running-process snapshot stays valid
+    PROCESS_LIST_TTL: float = 2.0
+    _process_snapshot: tuple[float, frozenset[str]] | None = None
+    # Locked-browser sets already reported to the user
+    _logged_locks: set[frozenset[str]] = set()
+
+    def __init__(
+        self,
+        runtime_manager: RuntimeManager,
+        config: AppConfig,
+        cancel_event: threading.Event | None = None,
+    ) -> None:
         """
         Initialize downloader.
 
         Args:
             runtime_manager: RuntimeManager instance for Deno configuration
             config: Application configuration
+            cancel_event: Cancellation flag to share with other downloaders
+                (default: a new one owned by this downloader)
         """
         self.runtime_manager = runtime_manager
         self.config = config
-        self._cancelled = False
+        self._cancel_event = cancel_event or threading.Event()
         self._fallback_browsers: list[str] = []  # Store fallback browsers for retry
         self._selected_browser: str | None = None  # Track selected browser for User-Agent matching
+        self._cookie_opts: dict[str, Any] | None = None  # Cookie source, reused across downloads
         self.last_downloaded_file: Path | None = None
+        self._cached_cookies_file: tuple[Path, int] | None = None  # (path, mtime_ns)
+        self._cookies_candidates: tuple[Path, ...] | None = None  # Resolved on first use
+        # One anonymous User-Agent per downloader, reused across retries
+        self._anonymous_ua = get_random_user_agent()
+
+        # yt-dlp options that never change between downloads; merged per call
+        self._base_ydl_opts: dict[str, Any] = {
+            "restrictfilenames": True,  # CRITICAL: Makes filenames Windows-safe
+            "windowsfilenames": True,  # CRITICAL: Extra Windows safety
+            "ignoreerrors": False,
+            "no_warnings": False,
+            "quiet": False,
+            "no_color": True,
+            "retries": 10,
+            "fragment_retries": "infinite",
+            "socket_timeout": 15,
+            "file_access_retries": 3,
+            "noplaylist": True,  # Default: download single video for safety
+        }
+
+    @property
+    def _cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @_cancelled.setter
+    def _cancelled(self, value: bool) -> None:
+        if value:
+            self._cancel_event.set()
+        else:
+            self._cancel_event.clear()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether cancel() has been called since the last reset."""
+        return self._cancel_event.is_set()
+
+    def reset_cancel(self) -> None:
+        """Clear a previous cancellation (shared with any clones)."""
+        self._cancel_event.clear()
+
+    def clone(self) -> "VideoDownloader":
+        """
+        Create a downloader for another worker thread.
+
+        The clone has its own cookie, User-Agent and last_downloaded_file
+        state, but shares the cancellation flag, so cancel() on either one
+        stops both.
+
+        Returns:
+            New VideoDownloader with the same runtime and configuration
+        """
+        return VideoDownloader(self.runtime_manager, self.config, self._cancel_event)
 
     def _is_browser_installed(self, browser: str) -> bool:
         """
@@ -123,10 +346,31 @@ class VideoDownloader:
             # For unknown browsers (safari), assume installed and let yt-dlp handle
             return True
 
-        for profile_path in self.BROWSER_PROFILE_PATHS[browser]:
-            if profile_path.exists():
-                return True
-        return False
+        return browser in self._detect_installed_browsers()
+
+    @classmethod
+    def _detect_installed_browsers(cls) -> frozenset[str]:
+        """
+        Snapshot which browsers have a profile directory, once per process.
+
+        A profile directory (rather than an executable or registry entry) is
+        what matters here: without one there are no cookies to extract.
+
+        Returns:
+            Names of browsers with an existing profile directory
+        """
+        if cls._installed_browsers is None:
+            cls._installed_browsers = frozenset(
+                browser
+                for browser, paths in cls.BROWSER_PROFILE_PATHS.items()
+                if any(path.exists() for path in paths)
+            )
+        return cls._installed_browsers
+
+    @classmethod
+    def clear_browser_cache(cls) -> None:
+        """Forget cached browser installation checks (e.g. after installing one)."""
+        cls._installed_browsers = None
 
     def _is_browser_running(self, browser: str) -> bool:
         """
@@ -148,60 +392,78 @@ class VideoDownloader:
         if not process_name:
             return False
 
-        # Windows: check tasklist
-        if os.name == "nt":
-            try:
-                result = subprocess.run(
-                    ["tasklist", "/FI", f"IMAGENAME eq {process_name}"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                    creationflags=subprocess.CREATE_NO_WINDOW,
-                )
-                return process_name.lower() in result.stdout.lower()
-            except Exception:
-                return False
-        else:
-            # Linux/macOS: use pgrep
-            try:
-                unix_name = process_name.replace(".exe", "")
-                result = subprocess.run(
-                    ["pgrep", "-x", unix_name],
-                    capture_output=True,
-                    timeout=5,
-                )
-                return result.returncode == 0
-            except Exception:
-                return False
+        if os.name != "nt":
+            process_name = process_name.replace(".exe", "")
+        return process_name.lower() in self._get_running_processes()
 
-    def _get_available_browsers(self) -> list[str]:
+    @classmethod
+    def _get_running_processes(cls) -> frozenset[str]:
         """
-        Get list of browsers that are installed AND not locked.
+        Get lowercased names of running processes from a single listing.
 
-        Returns browsers in priority order (Firefox first, then others).
+        One ``tasklist`` (Windows) or ``ps`` (Linux/macOS) call replaces a
+        spawn per browser; the snapshot is reused for PROCESS_LIST_TTL seconds
+        so retries don't list processes again.
 
         Returns:
-            List of available browser names
+            Set of process executable names (empty if listing fails)
         """
-        available = []
-        locked_browsers = []
+        now = time.monotonic()
+        snapshot = cls._process_snapshot
+        if snapshot is not None and now - snapshot[0] < cls.PROCESS_LIST_TTL:
+            return snapshot[1]
+
+        names: frozenset[str] = frozenset()
+        argv, run_kwargs, parse = _PROCESS_LISTER
+        try:
+            result = subprocess.run(argv, capture_output=True, text=True, timeout=5, **run_kwargs)
+            names = parse(result.stdout)
+        except Exception as e:
+            logger.debug(f"Process listing failed: {e}")
 
+        cls._process_snapshot = (now, names)
+        return names
+
+    def _collect_browser_state(self) -> dict[str, tuple[bool, bool]]:
+        """
+        Collect installation and lock state for every supported browser.
+
+        Both checks read cached snapshots, so after the first call this is
+        pure dictionary and set lookups.
+
+        Returns:
+            Mapping of browser name to (installed, running)
+        """
+        state = {}
         for browser in self.SUPPORTED_BROWSERS:
-            if not self._is_browser_installed(browser):
-                logger.debug(f"Browser not installed: {browser}")
-                continue
+            installed = self._is_browser_installed(browser)
+            state[browser] = (installed, installed and self._is_browser_running(browser))
+        return state
 
-            if self._is_browser_running(browser):
-                locked_browsers.append(browser)
-                logger.debug(f"Browser running (locked): {browser}")
-                continue
+    def _get_available_browsers(self) -> list[str]:
+        """
+        Get list of browsers that are installed AND not locked.
 
-            available.append(browser)
+        Returns browsers in priority order (Firefox first, then others).
+
+        Returns:
+            List of available browser names
+        """
+        state = self._collect_browser_state()
+        available = [b for b, (installed, running) in state.items() if installed and not running]
+        locked_browsers = [b for b, (_, running) in state.items() if running]
 
         if locked_browsers:
-            logger.warning(
-                f"Browsers with locked cookies (close for better auth): {', '.join(locked_browsers)}"
-            )
+            # Warn once per distinct set of locked browsers, not on every retry
+            key = frozenset(locked_browsers)
+            if key not in self._logged_locks:
+                self._logged_locks.add(key)
+                logger.warning(
+                    "Browsers with locked cookies (close for better auth): "
+                    f"{', '.join(locked_browsers)}"
+                )
+            else:
+                logger.debug(f"Browsers running (locked): {', '.join(locked_browsers)}")
 
         return available
 
@@ -212,26 +474,48 @@ class VideoDownloader:
         Returns:
             Path to cookies.txt if found and valid, None otherwise
         """
-        from video_downloader.utils.path_utils import get_application_path
-        from video_downloader.utils.user_dirs import get_downloads_folder
+        # Resolve the candidate locations once; the downloads folder lookup
+        # can hit the registry on Windows
+        if self._cookies_candidates is None:
+            from video_downloader.utils.path_utils import get_application_path
+            from video_downloader.utils.user_dirs import get_downloads_folder
+
+            self._cookies_candidates = (
+                get_application_path() / "cookies.txt",
+                Path.home() / "cookies.txt",
+                get_downloads_folder() / "cookies.txt",
+            )
 
-        search_locations = [
-            get_application_path() / "cookies.txt",
-            Path.home() / "cookies.txt",
-            get_downloads_folder() / "cookies.txt",
-        ]
+        # Reuse the file found on a previous attempt while it is unchanged
+        if self._cached_cookies_file is not None:
+            cached_path, cached_mtime = self._cached_cookies_file
+            try:
+                if cached_path.stat().st_mtime_ns == cached_mtime:
+                    return cached_path
+            except OSError:
+                pass
+            self._cached_cookies_file = None
+
+        for location in self._cookies_candidates:
+            # Open directly (no exists() pre-check) and read only the header
+            try:
+                fd = os.open(location, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                head = os.read(fd, 256)
+                mtime = os.fstat(fd).st_mtime_ns
+            except OSError:
+                continue
+            finally:
+                os.close(fd)
 
-        for location in search_locations:
-            if location.exists():
-                try:
-                    with location.open(encoding="utf-8") as f:
-                        first_line = f.readline().strip().lower()
-                        # Validate it's a Netscape cookie file
-                        if "cookie" in first_line or first_line.startswith("#"):
-                            logger.debug(f"Found valid cookies.txt: {location}")
-                            return location
-                except Exception:
-                    continue
+            # Validate it's a Netscape cookie file
+            first_line = head.split(b"\n", 1)[0].strip().lower()
+            if b"cookie" in first_line or first_line.startswith(b"#"):
+                logger.debug(f"Found valid cookies.txt: {location}")
+                self._cached_cookies_file = (location, mtime)
+                return location
 
         return None
 
@@ -250,28 +534,43 @@ class VideoDownloader:
         Returns:
             Updated options with browser cookie configuration
         """
+        # Browser detection is comparatively slow; reuse the chosen source until
+        # an auth error rotates it (see _rotate_cookie_source)
+        if self._cookie_opts is None:
+            self._cookie_opts = self._select_cookie_opts()
+
+        ydl_opts.pop("cookiesfrombrowser", None)
+        ydl_opts.pop("cookiefile", None)
+        ydl_opts.update(self._cookie_opts)
+        return ydl_opts
+
+    def _select_cookie_opts(self) -> dict[str, Any]:
+        """
+        Detect the best cookie source and return the yt-dlp options for it.
+
+        Also sets _selected_browser and _fallback_browsers when a browser is used.
+
+        Returns:
+            Cookie options (cookiesfrombrowser, cookiefile, or empty for anonymous)
+        """
         available_browsers = self._get_available_browsers()
 
         # Try available browsers in priority order
         if available_browsers:
             browser = available_browsers[0]
-            ydl_opts["cookiesfrombrowser"] = (browser, None, None, None)
             logger.info(f"Using {browser} cookies for authentication")
 
             # Store selected browser for User-Agent matching
             self._selected_browser = browser
             # Store fallback browsers for retry logic
             self._fallback_browsers = available_browsers[1:]
-            return ydl_opts
+            return {"cookiesfrombrowser": (browser, None, None, None)}
 
         # Fallback: Check for manual cookies.txt
         cookies_file = self._find_cookies_file()
         if cookies_file:
-            ydl_opts["cookiefile"] = str(cookies_file)
             logger.info(f"Using manual cookies file: {cookies_file}")
-            if "cookiesfrombrowser" in ydl_opts:
-                del ydl_opts["cookiesfrombrowser"]
-            return ydl_opts
+            return {"cookiefile": str(cookies_file)}
 
         # No cookies available
         logger.warning(
@@ -279,9 +578,22 @@ class VideoDownloader:
             "Firefox cookies are most reliable (Chrome encryption may block cookie access). "
             "Alternatively, export cookies to cookies.txt"
         )
-        if "cookiesfrombrowser" in ydl_opts:
-            del ydl_opts["cookiesfrombrowser"]
-        return ydl_opts
+        return {}
+
+    def _rotate_cookie_source(self) -> None:
+        """
+        Switch to the next fallback browser after an auth-related failure.
+
+        Without a fallback left, the cached choice is dropped so the next
+        attempt re-detects (a browser may have been closed in the meantime).
+        """
+        if self._fallback_browsers:
+            next_browser = self._fallback_browsers.pop(0)
+            self._selected_browser = next_browser
+            self._cookie_opts = {"cookiesfrombrowser": (next_browser, None, None, None)}
+            logger.info(f"Switching to {next_browser} cookies for next attempt")
+        else:
+            self._cookie_opts = None
 
     def _build_output_template(self, output_dir: Path, audio_format: str | None = None) -> str:
         """
@@ -298,11 +610,7 @@ class VideoDownloader:
         Returns:
             Output template string for yt-dlp
         """
-        # Always use %(ext)s - yt-dlp handles extension changes from postprocessors
-        # This prevents double extensions like .flac.flac when ExtractAudio runs
-        template = str(output_dir / "%(title).100s_%(id)s.%(ext)s")
-
-        return template
+        return _output_template(output_dir)
 
     def _get_format_config(
         self,
@@ -319,69 +627,8 @@ class VideoDownloader:
         Returns:
             Dictionary with format, postprocessors, and merge settings
         """
-        config: dict[str, Any] = {
-            "format": "bestvideo+bestaudio/best",
-            "postprocessors": [],
-            "merge_output_format": "mkv",
-        }
-
-        # Native quality: no re-encoding, no postprocessors
-        quality_lower = quality.lower()
-        if quality_lower == "native":
-            return {
-                "format": "bestvideo+bestaudio/best",
-                "merge_output_format": "mkv",
-                "postprocessors": [],
-            }
-
-        # Check if audio format requested
-        if audio_only or quality_lower in AUDIO_FORMATS:
-            audio_config = AUDIO_FORMATS.get(quality_lower, AUDIO_FORMATS["mp3"])
-
-            config["format"] = "bestaudio/best"
-            config["merge_output_format"] = None  # No video merge
-            config["postprocessors"] = [
-                {
-                    "key": "FFmpegExtractAudio",
-                    "preferredcodec": audio_config["codec"],
-                    "preferredquality": audio_config["quality"],
-                }
-            ]
-
-            # Add metadata
-            config["postprocessors"].append(
-                {
-                    "key": "FFmpegMetadata",
-                    "add_metadata": True,
-                }
-            )
-
-            # Embed thumbnail only for formats that support it
-            # Supported: mp3, mkv/mka, ogg/opus/flac, m4a/mp4/m4v/mov
-            # NOT supported: wav
-            thumbnail_supported_codecs = {"mp3", "opus", "flac", "aac", "m4a"}
-            if audio_config["codec"] in thumbnail_supported_codecs:
-                config["postprocessors"].append(
-                    {
-                        "key": "EmbedThumbnail",
-                    }
-                )
-                config["writethumbnail"] = True
-
-        else:
-            # Video quality
-            config["format"] = VIDEO_QUALITIES.get(quality_lower, VIDEO_QUALITIES["best"])
-            config["merge_output_format"] = "mkv"
-
-            # Add metadata to video
-            config["postprocessors"].append(
-                {
-                    "key": "FFmpegMetadata",
-                    "add_metadata": True,
-                }
-            )
-
-        return config
+        # Templates are shared; callers get their own copy to mutate
+        return copy.deepcopy(_format_config_template(quality.lower(), audio_only))
 
     def download(
         self,
@@ -408,19 +655,106 @@ class VideoDownloader:
             DownloadError: If download fails with specific error
         """
         self._cancelled = False
+        return self._download_attempt([url], output_path, progress_callback, quality, audio_only)
 
-        # Ensure output_path is a directory
-        if output_path.suffix:
-            # If a file path was passed, use its parent directory
-            output_dir = output_path.parent
-        else:
-            output_dir = output_path
+    def download_item(
+        self,
+        url: str,
+        output_path: Path,
+        progress_callback: Callable[[dict[str, Any]], None] | None = None,
+        quality: str = "best",
+        audio_only: bool = False,
+    ) -> bool:
+        """
+        Download one item of a batch, honouring a pending cancellation.
+
+        Unlike download(), this does not clear the cancel flag, so a cancel
+        issued while other items of the batch were running still applies.
+
+        Args:
+            url: Video URL to download
+            output_path: Output directory
+            progress_callback: Optional callback for progress updates
+            quality: Video quality or audio format
+            audio_only: Download audio only
+
+        Returns:
+            True if download succeeded, False if cancelled
+
+        Raises:
+            DownloadError: If download fails with specific error
+        """
+        return self._download_attempt([url], output_path, progress_callback, quality, audio_only)
+
+    def download_many(
+        self,
+        urls: list[str],
+        output_path: Path,
+        progress_callback: Callable[[dict[str, Any]], None] | None = None,
+        quality: str = "best",
+        audio_only: bool = False,
+    ) -> bool:
+        """
+        Download several videos in one yt-dlp session.
 
-        output_dir.mkdir(parents=True, exist_ok=True)
+        Options, cookie detection and the User-Agent are set up once and a
+        single YoutubeDL instance handles every URL. Downloads run in order
+        and the first failure stops the batch; "complete" progress events
+        carry the finished item's "url".
+
+        Args:
+            urls: Video URLs to download
+            output_path: Output directory
+            progress_callback: Optional callback for progress updates
+            quality: Video quality or audio format
+            audio_only: Download audio only
+
+        Returns:
+            True if every download succeeded, False if cancelled
+
+        Raises:
+            DownloadError: If a download fails with specific error
+        """
+        self._cancelled = False
+        if not urls:
+            return True
+        return self._download_attempt(
+            list(urls), output_path, progress_callback, quality, audio_only
+        )
+
+    def _download_attempt(
+        self,
+        urls: list[str],
+        output_path: Path,
+        progress_callback: Callable[[dict[str, Any]], None] | None,
+        quality: str,
+        audio_only: bool,
+    ) -> bool:
+        """
+        Run a single download attempt without clearing a pending cancellation.
+
+        Args:
+            urls: Video URLs to download in one yt-dlp session
+            output_path: Output directory
+            progress_callback: Optional callback for progress updates
+            quality: Video quality or audio format
+            audio_only: Download audio only
+
+        Returns:
+            True if download succeeded, False if cancelled
+
+        Raises:
+            DownloadError: If download fails with specific error
+        """
+        # Cancelled (e.g. during a retry backoff): skip directory and cookie setup
+        if self._cancelled:
+            logger.info("Download cancelled by user")
+            return False
+
+        output_dir = resolve_output(self.config, output_path)
 
         # Ensure download archive directory exists
-        archive_dir = Path.home() / ".video_downloader"
-        archive_dir.mkdir(parents=True, exist_ok=True)
+        archive_dir = ensure_dir(Path.home() / ".video_downloader")
 
         # Get format configuration
         format_config = self._get_format_config(quality, audio_only)
@@ -433,22 +767,13 @@ class VideoDownloader:
 
         # Build yt-dlp options
         ydl_opts: dict[str, Any] = {
+            **self._base_ydl_opts,
             **self.runtime_manager.get_ytdlp_options(),
             "outtmpl": self._build_output_template(output_dir, audio_format),
-            "restrictfilenames": True,  # CRITICAL: Makes filenames Windows-safe
-            "windowsfilenames": True,  # CRITICAL: Extra Windows safety
             "format": format_config["format"],
             "postprocessors": format_config["postprocessors"],
-            "ignoreerrors": False,
-            "no_warnings": False,
-            "quiet": False,
-            "no_color": True,
-            "retries": 10,
-            "fragment_retries": "infinite",
-            "socket_timeout": 15,
-            "file_access_retries": 3,
-            "noplaylist": True,  # Default: download single video for safety
             # Enable remote EJS components for YouTube challenge solving
+            # (fresh list per call; yt-dlp owns the options it is given)
             "remote_components": ["ejs:github"],
             "download_archive": str(archive_dir / "archive.txt"),
         }
@@ -460,12 +785,17 @@ class VideoDownloader:
         if self._selected_browser:
             user_agent = get_matching_user_agent(self._selected_browser)
         else:
-            user_agent = get_random_user_agent()
+            user_agent = self._anonymous_ua
         ydl_opts["http_headers"] = {"User-Agent": user_agent}
         logger.debug(f"Using User-Agent for {self._selected_browser or 'anonymous'}")
 
+        # Browser detection can take a while; don't start yt-dlp if cancelled meanwhile
+        if self._cancelled:
+            logger.info("Download cancelled by user")
+            return False
+
         # Detect Mix playlists and log warning
-        if is_mix_playlist(url):
+        if any(is_mix_playlist(url) for url in urls):
             logger.info(
                 "Detected YouTube Mix playlist - downloading single video only. "
                 "Mix playlists are dynamically generated and effectively infinite."
@@ -484,12 +814,12 @@ class VideoDownloader:
             ydl_opts["progress_hooks"] = [self._create_progress_hook(progress_callback)]
 
         try:
-            logger.info(f"Starting download: {url}")
+            logger.info(f"Starting download: {', '.join(urls)}")
             logger.info(f"Output directory: {output_dir}")
             logger.info(f"Quality: {quality} (format: {format_config['format']})")
 
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                retcode = ydl.download([url])
+                retcode = ydl.download(urls)
 
             if self._cancelled:
                 logger.info("Download cancelled by user")
@@ -519,6 +849,13 @@ class VideoDownloader:
             self._cancelled = True
             return False
 
+        except FileNotFoundError as e:
+            # A cached directory was removed mid-session; recreate it on retry
+            forget_dir(output_dir)
+            forget_dir(archive_dir)
+            logger.error(f"Output location missing: {e}")
+            raise DownloadError(f"Output location missing: {e}") from e
+
         except Exception as e:
             logger.error(f"Unexpected error: {e}", exc_info=True)
             raise DownloadError(f"Unexpected error: {e}") from e
@@ -542,31 +879,47 @@ class VideoDownloader:
                 raise KeyboardInterrupt("Download cancelled")
 
             try:
-                if d["status"] == "downloading":
+                # Bind once: yt-dlp can call this hundreds of times a second.
+                # Plain == is kept: CPython already short-circuits on identity.
+                status = d["status"]
+                get = d.get
+                if status == "downloading":
+                    downloaded = get("downloaded_bytes") or 0
+                    total = get("total_bytes") or get("total_bytes_estimate") or 0
+
+                    # Numeric progress so consumers never re-parse "45.3%"
+                    percent = get("_percent")
+                    if percent is not None:
+                        fraction = percent / 100.0
+                    elif total:
+                        fraction = downloaded / total
+                    else:
+                        fraction = 0.0
+
                     progress_info = {
                         "status": "downloading",
-                        "percentage": d.get("_percent_str", "0%").strip(),
-                        "speed": d.get("_speed_str", "N/A").strip(),
-                        "eta": d.get("_eta_str", "N/A").strip(),
-                        "downloaded_bytes": d.get("downloaded_bytes", 0),
-                        "total_bytes": d.get("total_bytes") or d.get("total_bytes_estimate", 0),
+                        "percentage": get("_percent_str", "0%").strip(),
+                        "fraction": min(max(fraction, 0.0), 1.0),
+                        "speed": get("_speed_str", "N/A").strip(),
+                        "eta": get("_eta_str", "N/A").strip(),
+                        "downloaded_bytes": downloaded,
+                        "total_bytes": total,
                     }
                     callback(progress_info)
 
-                elif d["status"] == "finished":
-                    filename = d.get("filename") or str(
-                        d.get("info_dict", {}).get("filepath", "")
-                    )
+                elif status == "finished":
+                    filename = get("filename") or str(get("info_dict", {}).get("filepath", ""))
                     if filename:
                         self.last_downloaded_file = Path(filename)
                     callback(
                         {
                             "status": "complete",
                             "filename": filename,
+                            "url": (get("info_dict") or {}).get("webpage_url"),
                         }
                     )
 
-                elif d["status"] == "error":
+                elif status == "error":
                     callback(
                         {
                             "status": "error",
@@ -598,9 +951,9 @@ class VideoDownloader:
         Returns:
             Delay in seconds
         """
-        delay = min(base_delay * (2**attempt), max_delay)
+        delay = min(base_delay * (1 << attempt), max_delay)
         # Add jitter (0-50% of delay) to prevent thundering herd
-        jitter = random.uniform(0, delay * 0.5)
+        jitter = random.random() * (delay * 0.5)
         return delay + jitter
 
     def _classify_error(self, error_msg: str) -> tuple[bool, str]:
@@ -615,23 +968,9 @@ class VideoDownloader:
         """
         error_lower = error_msg.lower()
 
-        # Fatal errors - don't retry
-        if any(x in error_lower for x in ["unavailable", "private", "deleted", "removed"]):
-            return False, "video_unavailable"
-        if any(x in error_lower for x in ["copyright", "blocked", "not available in your country"]):
-            return False, "geo_blocked"
-        if "drm" in error_lower or "protected" in error_lower:
-            return False, "drm_protected"
-
-        # Recoverable errors - retry with different strategy
-        if any(x in error_lower for x in ["403", "forbidden"]):
-            return True, "forbidden"
-        if any(x in error_lower for x in ["bot", "sign in", "confirm you"]):
-            return True, "bot_detection"
-        if any(x in error_lower for x in ["429", "too many", "rate limit"]):
-            return True, "rate_limited"
-        if any(x in error_lower for x in ["timeout", "timed out", "connection"]):
-            return True, "network"
+        for is_recoverable, category, pattern in _ERROR_CLASSES:
+            if pattern.search(error_lower):
+                return is_recoverable, category
 
         # Unknown error - try to recover
         return True, "unknown"
@@ -679,8 +1018,9 @@ class VideoDownloader:
                 time.sleep(delay)
 
             try:
-                success = self.download(
-                    url=url,
+                # Not download(): a cancel during the backoff above must stick
+                success = self._download_attempt(
+                    urls=[url],
                     output_path=output_path,
                     progress_callback=progress_callback,
                     quality=quality,
@@ -707,10 +1047,8 @@ class VideoDownloader:
                 )
 
                 # Try next fallback browser on auth-related errors
-                if error_category in ("forbidden", "bot_detection") and self._fallback_browsers:
-                    next_browser = self._fallback_browsers.pop(0)
-                    self._selected_browser = next_browser
-                    logger.info(f"Switching to {next_browser} cookies for next attempt")
+                if error_category in ("forbidden", "bot_detection"):
+                    self._rotate_cookie_source()
 
                 continue
 
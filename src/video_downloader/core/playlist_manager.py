@@ -4,18 +4,27 @@ Playlist management for batch video downloads.
 Provides playlist detection, extraction, and progress tracking.
 """
 
+import hashlib
+import json
 import logging
 import re
+import threading
+import time
+import weakref
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from types import TracebackType
 from typing import TYPE_CHECKING, Any
 
 import yt_dlp
 
 from video_downloader.core.runtime_manager import RuntimeManager
-from video_downloader.utils.constants import ILLEGAL_FILENAME_CHARS
+from video_downloader.utils.constants import ILLEGAL_FILENAME_CHARS, PLAYLIST_INFO_CACHE_TTL
+from video_downloader.utils.path_utils import ensure_dir
 from video_downloader.utils.validators import is_mix_playlist as _is_mix_playlist
 
 if TYPE_CHECKING:
@@ -23,6 +32,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Maps every illegal filename character to "_" for str.translate
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys(ILLEGAL_FILENAME_CHARS, "_"))
+_ILLEGAL_CHARS = frozenset(ILLEGAL_FILENAME_CHARS)
+
 
 class DownloadStatus(Enum):
     """Status of a playlist item download."""
@@ -34,7 +47,7 @@ class DownloadStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistItem:
     """Individual video in a playlist."""
 
@@ -48,7 +61,7 @@ class PlaylistItem:
     output_path: Path | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistInfo:
     """Playlist metadata and items."""
 
@@ -59,16 +72,50 @@ class PlaylistInfo:
     total_count: int
     items: list[PlaylistItem] = field(default_factory=list)
     current_index: int = 0
+    # Maintained by set_item_status so the counts are O(1)
+    _completed: int = field(default=0, init=False, repr=False, compare=False)
+    _failed: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Count items that already carry a final status."""
+        for item in self.items:
+            if item.status == DownloadStatus.COMPLETE:
+                self._completed += 1
+            elif item.status == DownloadStatus.FAILED:
+                self._failed += 1
 
     @property
     def completed_count(self) -> int:
         """Count of successfully downloaded items."""
-        return sum(1 for item in self.items if item.status == DownloadStatus.COMPLETE)
+        return self._completed
 
     @property
     def failed_count(self) -> int:
         """Count of failed downloads."""
-        return sum(1 for item in self.items if item.status == DownloadStatus.FAILED)
+        return self._failed
+
+    def set_item_status(self, item: PlaylistItem, status: DownloadStatus) -> None:
+        """
+        Change an item's status and keep the counters in step.
+
+        Not thread-safe; concurrent callers must serialize.
+
+        Args:
+            item: Item belonging to this playlist
+            status: New status
+        """
+        old = item.status
+        if old == status:
+            return
+        if old == DownloadStatus.COMPLETE:
+            self._completed -= 1
+        elif old == DownloadStatus.FAILED:
+            self._failed -= 1
+        if status == DownloadStatus.COMPLETE:
+            self._completed += 1
+        elif status == DownloadStatus.FAILED:
+            self._failed += 1
+        item.status = status
 
 
 class PlaylistManager:
@@ -82,18 +129,73 @@ class PlaylistManager:
         r"youtube\.com/watch\?.*&list=",
         r"youtu\.be/.*\?list=",
     ]
+    # All patterns as one compiled alternation, scanned in a single pass
+    _PLAYLIST_RE = re.compile("|".join(f"(?:{pattern})" for pattern in PLAYLIST_PATTERNS))
 
     # Default limit for Mix playlists (prevent infinite download)
     MIX_PLAYLIST_LIMIT = 25
 
-    def __init__(self, runtime_manager: RuntimeManager) -> None:
+    def __init__(self, runtime_manager: RuntimeManager, cache_dir: Path | None = None) -> None:
         """
         Initialize playlist manager.
 
         Args:
             runtime_manager: RuntimeManager for yt-dlp configuration
+            cache_dir: Directory for cached playlist metadata
+                (default: ~/.video_downloader/playlist_info)
         """
         self.runtime_manager = runtime_manager
+        self.cache_dir = cache_dir or Path.home() / ".video_downloader" / "playlist_info"
+        # Idle extraction-only YoutubeDL instances, keyed by frozen options. A
+        # YoutubeDL is not safe to share across threads, so each extraction
+        # checks one out and returns it afterwards; concurrent extractions
+        # each get their own instance
+        self._ydl_pool: dict[Any, list[yt_dlp.YoutubeDL]] = {}
+        # Guards _ydl_pool only; extraction itself runs unlocked
+        self._ydl_lock = threading.Lock()
+        # Close pooled instances when the manager is collected without shutdown()
+        weakref.finalize(self, _close_ydls, self._ydl_pool, self._ydl_lock)
+
+    def __enter__(self) -> "PlaylistManager":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+    def _acquire_ydl(self, ydl_opts: dict[str, Any]) -> tuple[Any, yt_dlp.YoutubeDL]:
+        """
+        Check out an idle YoutubeDL for these options, creating one if none is free.
+
+        Args:
+            ydl_opts: yt-dlp options
+
+        Returns:
+            Tuple of (pool key, YoutubeDL instance); pass both to _release_ydl()
+        """
+        key = _freeze(ydl_opts)
+        with self._ydl_lock:
+            idle = self._ydl_pool.get(key)
+            if idle:
+                return key, idle.pop()
+        return key, yt_dlp.YoutubeDL(ydl_opts)
+
+    def _release_ydl(self, key: Any, ydl: yt_dlp.YoutubeDL) -> None:
+        """Return a YoutubeDL checked out by _acquire_ydl() to the pool."""
+        with self._ydl_lock:
+            self._ydl_pool.setdefault(key, []).append(ydl)
+
+    def shutdown(self) -> None:
+        """Close pooled YoutubeDL instances."""
+        _close_ydls(self._ydl_pool, self._ydl_lock)
+
+    def close(self) -> None:
+        """Alias for shutdown()."""
+        self.shutdown()
 
     def is_playlist_url(self, url: str) -> bool:
         """
@@ -105,7 +207,19 @@ class PlaylistManager:
         Returns:
             True if URL is a playlist
         """
-        return any(re.search(pattern, url) for pattern in self.PLAYLIST_PATTERNS)
+        return _is_playlist_url(url)
+
+    def classify_urls(self, urls: list[str]) -> list[bool]:
+        """
+        Check a batch of URLs (e.g. a pasted list) for playlists.
+
+        Args:
+            urls: URLs to check
+
+        Returns:
+            One flag per URL, True where the URL is a playlist
+        """
+        return list(map(_is_playlist_url, urls))
 
     def is_mix_playlist(self, url: str) -> bool:
         """
@@ -163,25 +277,103 @@ class PlaylistManager:
         opts["ignoreerrors"] = True  # Skip unavailable videos
         return opts
 
-    def extract_playlist_info(self, url: str) -> PlaylistInfo | None:
+    def _cache_path(self, url: str) -> Path:
+        """Path of the cached metadata file for a playlist URL."""
+        return self.cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+    def _load_cached_info(self, url: str) -> PlaylistInfo | None:
+        """
+        Load playlist metadata cached by a previous extraction.
+
+        Args:
+            url: Playlist URL
+
+        Returns:
+            PlaylistInfo with pending items, or None if missing, stale or unreadable
+        """
+        path = self._cache_path(url)
+        try:
+            if time.time() - path.stat().st_mtime > PLAYLIST_INFO_CACHE_TTL:
+                return None
+            data = json.loads(path.read_text(encoding="utf-8"))
+            data["items"] = [PlaylistItem(**item) for item in data["items"]]
+            return PlaylistInfo(**data)
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.debug(f"Ignoring unreadable playlist cache {path}: {e}")
+            return None
+
+    def _save_cached_info(self, playlist: PlaylistInfo) -> None:
+        """
+        Cache playlist metadata on disk (download state is not stored).
+
+        Args:
+            playlist: Freshly extracted playlist
+        """
+        data = {
+            "playlist_id": playlist.playlist_id,
+            "title": playlist.title,
+            "uploader": playlist.uploader,
+            "url": playlist.url,
+            "total_count": playlist.total_count,
+            "items": [
+                {
+                    "index": item.index,
+                    "video_id": item.video_id,
+                    "title": item.title,
+                    "url": item.url,
+                    "duration": item.duration,
+                }
+                for item in playlist.items
+            ],
+        }
+        path = self._cache_path(playlist.url)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            ensure_dir(self.cache_dir)
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            # Atomic swap so a concurrent reader never sees a partial file
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.debug(f"Could not cache playlist info: {e}")
+
+    def extract_playlist_info(self, url: str, force_refresh: bool = False) -> PlaylistInfo | None:
         """
         Extract playlist metadata without downloading.
 
+        Results are cached on disk for PLAYLIST_INFO_CACHE_TTL seconds so
+        re-opening or re-queueing a playlist skips the extractor.
+
         Args:
             url: Playlist URL
+            force_refresh: Ignore the cache and extract again
 
         Returns:
             PlaylistInfo or None if not a playlist
         """
+        if not force_refresh:
+            cached = self._load_cached_info(url)
+            if cached is not None:
+                logger.debug(f"Using cached playlist info for {url}")
+                return cached
+
         ydl_opts = {
             **self.runtime_manager.get_ytdlp_options(),
             "extract_flat": True,  # Don't download, just get info
+            "lazy_playlist": True,  # Stream entries instead of prefetching every page
+            # Manifests are only needed for downloading, not for listing entries
+            "extractor_args": {"youtube": {"skip": ["dash", "hls", "translated_subs"]}},
             "quiet": True,
             "no_warnings": True,
         }
+        if self.is_mix_playlist(url):
+            # Mix playlists are endless; cap them at the source
+            ydl_opts["playlistend"] = self.MIX_PLAYLIST_LIMIT
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            # Reuse the YoutubeDL (and its extractor registry) across extractions
+            key, ydl = self._acquire_ydl(ydl_opts)
+            try:
                 info = ydl.extract_info(url, download=False)
 
                 if not info:
@@ -191,10 +383,10 @@ class PlaylistManager:
                 if "entries" not in info:
                     return None
 
-                entries = list(info["entries"])
-
+                # Consume entries as yt-dlp yields them (lazy_playlist); each
+                # entry dict can be freed once its PlaylistItem is built
                 items = []
-                for i, entry in enumerate(entries):
+                for i, entry in enumerate(info["entries"]):
                     if entry is None:  # Unavailable video
                         continue
 
@@ -207,15 +399,20 @@ class PlaylistManager:
                             duration=entry.get("duration"),
                         )
                     )
-
-                return PlaylistInfo(
-                    playlist_id=info.get("id", ""),
-                    title=info.get("title", "Unknown Playlist"),
-                    uploader=info.get("uploader", "Unknown"),
-                    url=url,
-                    total_count=len(items),
-                    items=items,
-                )
+            finally:
+                # Lazy entries are fetched through this instance, so hold it until consumed
+                self._release_ydl(key, ydl)
+
+            playlist = PlaylistInfo(
+                playlist_id=info.get("id", ""),
+                title=info.get("title", "Unknown Playlist"),
+                uploader=info.get("uploader", "Unknown"),
+                url=url,
+                total_count=len(items),
+                items=items,
+            )
+            self._save_cached_info(playlist)
+            return playlist
 
         except Exception as e:
             logger.error(f"Failed to extract playlist info: {e}")
@@ -229,6 +426,7 @@ class PlaylistManager:
         quality: str,
         progress_callback: Callable[[dict[str, Any]], None] | None = None,
         audio_only: bool = False,
+        max_workers: int = 1,
     ) -> dict[str, Any]:
         """
         Download all videos in a playlist.
@@ -240,6 +438,7 @@ class PlaylistManager:
             quality: Quality preset
             progress_callback: Callback for progress updates
             audio_only: Download audio only
+            max_workers: Number of items downloaded concurrently (1 = in order)
 
         Returns:
             Results dictionary with counts and item statuses
@@ -253,75 +452,136 @@ class PlaylistManager:
 
         # Create playlist subfolder
         playlist_dir = output_dir / self._sanitize_dirname(playlist.title)
-        playlist_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(playlist_dir)
 
-        for item in playlist.items:
-            if downloader._cancelled:
-                item.status = DownloadStatus.SKIPPED
-                results["skipped"] += 1
-                continue
+        # Guards results, playlist.current_index and the progress callback
+        lock = threading.Lock()
 
-            playlist.current_index = item.index
-            item.status = DownloadStatus.DOWNLOADING
+        # Constant part of the per-item events, built once per playlist
+        start_base = {
+            "type": "playlist_item_start",
+            "total": playlist.total_count,
+            "playlist_title": playlist.title,
+        }
+        complete_base = {"type": "playlist_item_complete", "total": playlist.total_count}
 
-            # Notify progress
+        def notify(event: dict[str, Any]) -> None:
             if progress_callback:
-                progress_callback(
-                    {
-                        "type": "playlist_item_start",
-                        "index": item.index,
-                        "total": playlist.total_count,
-                        "title": item.title,
-                        "playlist_title": playlist.title,
-                    }
-                )
+                with lock:
+                    progress_callback(event)
+
+        # One downloader per worker thread: cookie rotation and
+        # last_downloaded_file are per-instance state. Clones share the
+        # cancel flag, so downloader.cancel() still stops every worker.
+        workers = threading.local()
+
+        def worker_downloader() -> "VideoDownloader":
+            if max_workers <= 1:
+                return downloader
+            own = getattr(workers, "downloader", None)
+            if own is None:
+                own = workers.downloader = downloader.clone()
+            return own
+
+        def download_one(item: PlaylistItem) -> None:
+            if downloader.is_cancelled:
+                with lock:
+                    playlist.set_item_status(item, DownloadStatus.SKIPPED)
+                    results["skipped"] += 1
+                return
+
+            with lock:
+                playlist.current_index = item.index
+                playlist.set_item_status(item, DownloadStatus.DOWNLOADING)
+
+            # Notify progress
+            notify({**start_base, "index": item.index, "title": item.title})
 
             try:
-                success = downloader.download(
+                # download_item() rather than download(): download() clears
+                # the cancel flag, which would race with the other workers
+                success = worker_downloader().download_item(
                     item.url,
                     playlist_dir,
-                    progress_callback,
+                    notify if progress_callback else None,
                     quality,
                     audio_only,
                 )
 
+            except Exception as e:
+                success = False
+                item.error_message = str(e)
+                logger.error(f"Failed to download {item.title}: {e}")
+
+            with lock:
                 if success:
-                    item.status = DownloadStatus.COMPLETE
+                    playlist.set_item_status(item, DownloadStatus.COMPLETE)
                     results["completed"] += 1
                 else:
-                    item.status = DownloadStatus.FAILED
+                    playlist.set_item_status(item, DownloadStatus.FAILED)
                     results["failed"] += 1
-
-            except Exception as e:
-                item.status = DownloadStatus.FAILED
-                item.error_message = str(e)
-                results["failed"] += 1
-                logger.error(f"Failed to download {item.title}: {e}")
+                completed, failed = results["completed"], results["failed"]
 
             # Notify item complete
-            if progress_callback:
-                progress_callback(
-                    {
-                        "type": "playlist_item_complete",
-                        "index": item.index,
-                        "total": playlist.total_count,
-                        "status": item.status.value,
-                        "completed": results["completed"],
-                        "failed": results["failed"],
-                    }
-                )
+            notify(
+                {
+                    **complete_base,
+                    "index": item.index,
+                    "status": item.status.value,
+                    "completed": completed,
+                    "failed": failed,
+                }
+            )
+
+        downloader.reset_cancel()
+        if max_workers <= 1:
+            for item in playlist.items:
+                download_one(item)
+            return results
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="playlist") as executor:
+            # Items still queued when a cancel arrives see the flag and are skipped
+            for future in as_completed([executor.submit(download_one, i) for i in playlist.items]):
+                future.result()
 
         return results
 
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize string for use as filename."""
-        # Remove/replace illegal characters
-        for char in ILLEGAL_FILENAME_CHARS:
-            name = name.replace(char, "_")
+        # Most titles are already clean; skip the translate copy for them
+        if len(name) <= 100 and _ILLEGAL_CHARS.isdisjoint(name):
+            return name.strip(". ")
 
-        # Limit length
-        return name[:100].strip(". ")
+        # Replace illegal characters in one pass, then limit length
+        return name.translate(_SANITIZE_TABLE)[:100].strip(". ")
 
     def _sanitize_dirname(self, name: str) -> str:
         """Sanitize string for use as directory name."""
         return self._sanitize_filename(name)
+
+
+@lru_cache(maxsize=1024)
+def _is_playlist_url(url: str) -> bool:
+    """Classify a URL as a playlist; memoized since URLs are often re-queued."""
+    return PlaylistManager._PLAYLIST_RE.search(url) is not None
+
+
+def _close_ydls(pool: dict[Any, list[yt_dlp.YoutubeDL]], lock: threading.Lock) -> None:
+    """Close and drop every YoutubeDL in a PlaylistManager's pool."""
+    with lock:
+        ydls = [ydl for idle in pool.values() for ydl in idle]
+        pool.clear()
+    for ydl in ydls:
+        try:
+            ydl.close()
+        except Exception as e:
+            logger.debug(f"Error closing YoutubeDL: {e}")
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested option dicts/lists into a hashable equivalent."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
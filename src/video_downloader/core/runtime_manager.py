@@ -7,8 +7,8 @@ Supports multiple JS runtimes: Deno, Node.js, and Bun.
 
 import logging
 import os
-import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +18,97 @@ from video_downloader.utils.path_utils import get_bin_path, get_subprocess_kwarg
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _path_executables(path_env: str, pathext: str) -> dict[str, tuple[str, ...]]:
+    """
+    Index the files in every PATH directory with one scandir per directory.
+
+    Args:
+        path_env: Value of PATH (part of the cache key)
+        pathext: Value of PATHEXT on Windows, empty elsewhere
+
+    Returns:
+        Command name -> candidate file paths in PATH order
+        (names are lowercased and stripped of their PATHEXT suffix on Windows)
+    """
+    extensions = {ext.lower() for ext in pathext.split(os.pathsep) if ext}
+    found: dict[str, list[str]] = {}
+    for directory in path_env.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if extensions:
+                        stem, dot, ext = name.rpartition(".")
+                        if not dot or f".{ext.lower()}" not in extensions:
+                            continue
+                        name = stem.lower()
+                    found.setdefault(name, []).append(entry.path)
+        except OSError:
+            continue
+    return {name: tuple(paths) for name, paths in found.items()}
+
+
+def _probe_first_line(argv: list[str], timeout: float = 2.0) -> str | None:
+    """
+    Run a version command and return the first line of its output.
+
+    Output stays bytes until the first line is split off, so long listings
+    (``ffmpeg -version`` prints its whole build configuration) are never decoded.
+
+    Args:
+        argv: Command line to run
+        timeout: Seconds to wait; version commands answer immediately
+
+    Returns:
+        First stdout line, or None if the command exited non-zero
+
+    Raises:
+        subprocess.TimeoutExpired: If the command hangs (it is killed)
+        OSError: If the command cannot be started
+    """
+    with subprocess.Popen(
+        argv,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        **get_subprocess_kwargs(),
+    ) as proc:
+        try:
+            stdout, _ = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            raise
+    if proc.returncode != 0:
+        return None
+    return stdout.split(b"\n", 1)[0].decode("utf-8", "replace").strip()
+
+
+def _which(command: str) -> Path | None:
+    """
+    Locate an executable on PATH, like shutil.which, from a cached PATH index.
+
+    Args:
+        command: Command name without extension (e.g. "ffmpeg")
+
+    Returns:
+        Path to the first matching executable, or None
+    """
+    if os.name == "nt":
+        pathext = os.environ.get("PATHEXT") or ".COM;.EXE;.BAT;.CMD"
+        command = command.lower()
+    else:
+        pathext = ""
+    index = _path_executables(os.environ.get("PATH", ""), pathext)
+    for candidate in index.get(command, ()):
+        path = Path(candidate)
+        if path.is_file() and (os.name == "nt" or os.access(candidate, os.X_OK)):
+            return path
+    return None
+
+
 class RuntimeManager:
     """
     Manages external runtime dependencies.
@@ -42,6 +133,9 @@ class RuntimeManager:
         self.deno_path: Path | None = None
         self.ffmpeg_path: Path | None = None
         self.ffprobe_path: Path | None = None
+        self._ytdlp_opts: dict[str, Any] | None = None  # Built on first request
+        # Version probe results by runtime ("js", "deno", "ffmpeg"); None = probe failed
+        self._versions: dict[str, str | None] = {}
 
         self._discover_js_runtime()
         self._discover_ffmpeg()
@@ -70,12 +164,12 @@ class RuntimeManager:
                 return
 
             # 2. Check system PATH
-            system_path = shutil.which(exe_name.replace(".exe", ""))
+            system_path = _which(unix_exe)
             if system_path:
-                self.js_runtime_path = Path(system_path)
+                self.js_runtime_path = system_path
                 self.js_runtime_name = name
                 if name == "deno":
-                    self.deno_path = Path(system_path)
+                    self.deno_path = system_path
                 logger.info(f"Using system {name}: {system_path}")
                 return
 
@@ -99,9 +193,9 @@ class RuntimeManager:
             logger.info(f"Using bundled FFmpeg: {bundled_ffmpeg}")
         else:
             # 2. Check system PATH
-            system_ffmpeg = shutil.which("ffmpeg")
+            system_ffmpeg = _which("ffmpeg")
             if system_ffmpeg:
-                self.ffmpeg_path = Path(system_ffmpeg)
+                self.ffmpeg_path = system_ffmpeg
                 logger.info(f"Using system FFmpeg: {system_ffmpeg}")
             else:
                 raise RuntimeNotFoundError(
@@ -113,9 +207,9 @@ class RuntimeManager:
         if bundled_ffprobe.exists():
             self.ffprobe_path = bundled_ffprobe
         else:
-            system_ffprobe = shutil.which("ffprobe")
+            system_ffprobe = _which("ffprobe")
             if system_ffprobe:
-                self.ffprobe_path = Path(system_ffprobe)
+                self.ffprobe_path = system_ffprobe
 
         # Verify FFmpeg is functional
         self._verify_ffmpeg_version()
@@ -131,15 +225,11 @@ class RuntimeManager:
             return False
 
         try:
-            result = subprocess.run(
-                [str(self.ffmpeg_path), "-version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                **get_subprocess_kwargs(),
-            )
-            if result.returncode == 0 and "ffmpeg version" in result.stdout.lower():
-                logger.info(f"FFmpeg verified: {result.stdout.split(chr(10))[0]}")
+            first_line = _probe_first_line([str(self.ffmpeg_path), "-version"])
+            if first_line and "ffmpeg version" in first_line.lower():
+                # Same output get_ffmpeg_version() would probe for; keep it
+                self._versions["ffmpeg"] = first_line
+                logger.info(f"FFmpeg verified: {first_line}")
                 return True
             else:
                 logger.warning("FFmpeg found but version check returned unexpected output")
@@ -155,6 +245,21 @@ class RuntimeManager:
         """
         Get yt-dlp options configured for discovered runtimes.
 
+        The options are built once (runtime paths don't change after
+        discovery); each call returns a shallow copy that callers may extend.
+        Nested values such as ``js_runtimes`` are shared and must not be mutated.
+
+        Returns:
+            Dictionary of yt-dlp options
+        """
+        if self._ytdlp_opts is None:
+            self._ytdlp_opts = self._build_ytdlp_options()
+        return dict(self._ytdlp_opts)
+
+    def _build_ytdlp_options(self) -> dict[str, Any]:
+        """
+        Build yt-dlp options for the discovered runtimes.
+
         Returns:
             Dictionary of yt-dlp options
         """
@@ -195,64 +300,76 @@ class RuntimeManager:
         """Check if any JS runtime is available (backward compatibility)."""
         return self.is_js_runtime_available()
 
+    def invalidate(self) -> None:
+        """Forget cached version probes and yt-dlp options (e.g. after an update)."""
+        self._versions.clear()
+        self._ytdlp_opts = None
+
     def get_js_runtime_version(self) -> str | None:
-        """Get version string for the active JavaScript runtime."""
+        """Get version string for the active JavaScript runtime (probed once)."""
         if not self.is_js_runtime_available():
             return None
+        if "js" in self._versions:
+            return self._versions["js"]
 
+        version: str | None = None
         try:
-            result = subprocess.run(
-                [str(self.js_runtime_path), "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                **get_subprocess_kwargs(),
-            )
-            if result.returncode == 0:
-                version = result.stdout.split("\n")[0].strip()
-                return f"{self.js_runtime_name} {version}"
+            first_line = _probe_first_line([str(self.js_runtime_path), "--version"])
+            if first_line is not None:
+                version = f"{self.js_runtime_name} {first_line}"
         except Exception as e:
             logger.warning(f"Failed to get {self.js_runtime_name} version: {e}")
-        return None
+
+        self._versions["js"] = version
+        return version
 
     def get_deno_version(self) -> str | None:
-        """Get Deno version string (backward compatibility)."""
+        """Get Deno version string (backward compatibility; probed once)."""
         if not self.is_deno_available():
             return None
+        if "deno" in self._versions:
+            return self._versions["deno"]
 
+        version: str | None = None
         try:
-            result = subprocess.run(
-                [str(self.deno_path), "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                **get_subprocess_kwargs(),
-            )
-            if result.returncode == 0:
-                # First line contains "deno X.X.X"
-                return result.stdout.split("\n")[0].strip()
+            # First line contains "deno X.X.X"
+            version = _probe_first_line([str(self.deno_path), "--version"])
         except Exception as e:
             logger.warning(f"Failed to get Deno version: {e}")
 
-        return None
+        self._versions["deno"] = version
+        return version
 
     def get_ffmpeg_version(self) -> str | None:
-        """Get FFmpeg version string."""
+        """Get FFmpeg version string (probed once)."""
         if not self.is_ffmpeg_available():
             return None
+        if "ffmpeg" in self._versions:
+            return self._versions["ffmpeg"]
 
+        version: str | None = None
         try:
-            result = subprocess.run(
-                [str(self.ffmpeg_path), "-version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                **get_subprocess_kwargs(),
-            )
-            if result.returncode == 0:
-                # First line contains version info
-                return result.stdout.split("\n")[0].strip()
+            # First line contains version info
+            version = _probe_first_line([str(self.ffmpeg_path), "-version"])
         except Exception as e:
             logger.warning(f"Failed to get FFmpeg version: {e}")
 
-        return None
+        self._versions["ffmpeg"] = version
+        return version
+
+
+@lru_cache(maxsize=1)
+def get_runtime_manager() -> RuntimeManager:
+    """
+    Get the process-wide RuntimeManager, discovering runtimes on first call.
+
+    Discovery probes the filesystem and runs ``ffmpeg -version``, so callers
+    should share one instance rather than constructing their own.
+
+    Returns:
+        Shared RuntimeManager instance
+
+    Raises:
+        RuntimeNotFoundError: If FFmpeg is not found (not cached; retried next call)
+    """
+    return RuntimeManager()
@@ -4,7 +4,11 @@ Diagnostics pane component for GUI.
 Provides system diagnostics and logging display with scrollable textbox.
 """
 
+import contextlib
+import queue
+import threading
 import tkinter as tk
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from tkinter import filedialog
@@ -19,6 +23,13 @@ class DiagnosticsPane(ctk.CTkFrame):
     Displays log messages with timestamps and severity levels.
     """
 
+    # Delay before buffered log lines are written to the textbox
+    FLUSH_DELAY_MS = 50
+    # Interval at which the UI thread checks for finished log exports
+    EXPORT_POLL_MS = 100
+    # Lines kept in the textbox; older lines are dropped from the top
+    MAX_LINES = 5000
+
     def __init__(self, master: ctk.CTk | ctk.CTkFrame):
         """
         Initialize diagnostics pane.
@@ -28,6 +39,18 @@ class DiagnosticsPane(ctk.CTkFrame):
         """
         super().__init__(master)
 
+        # Pending (text, tag) entries, written in one insert per flush
+        self._log_buffer: deque[tuple[str, str]] = deque()
+        self._log_lock = threading.Lock()
+        self._flush_after_id: str | None = None
+        # Same window of entries as the textbox, for get_logs() and export
+        self._history: deque[str] = deque(maxlen=self.MAX_LINES)
+        self._line_count = 0  # Lines currently in the textbox
+        # (message, level) results from export threads, reported by the UI thread
+        self._export_results: queue.SimpleQueue[tuple[str, str]] = queue.SimpleQueue()
+        self._exports_pending = 0  # UI thread only
+        self._export_poll_id: str | None = None
+
         # Configure grid
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -94,7 +117,8 @@ class DiagnosticsPane(ctk.CTkFrame):
         except tk.TclError:
             has_selection = False
 
-        has_content = bool(self.textbox.get("0.0", "end").strip())
+        # Compare end index with the start instead of copying the whole text out of Tk
+        has_content = self.textbox.index("end-1c") != "1.0"
 
         # Copy
         menu.add_command(
@@ -136,11 +160,12 @@ class DiagnosticsPane(ctk.CTkFrame):
             self.clipboard_clear()
             self.clipboard_append(selected)
         except tk.TclError:
-            # No selection, copy all
-            content = self.textbox.get("0.0", "end").strip()
-            if content:
-                self.clipboard_clear()
-                self.clipboard_append(content)
+            # No selection, copy all (only fetch the text if there is any)
+            if self.textbox.index("end-1c") != "1.0":
+                content = self.textbox.get("0.0", "end").strip()
+                if content:
+                    self.clipboard_clear()
+                    self.clipboard_append(content)
         return "break"
 
     def _select_all(self, event: tk.Event | None = None) -> str:
@@ -165,11 +190,45 @@ class DiagnosticsPane(ctk.CTkFrame):
         # Determine tag for color
         tag = level if level in ("INFO", "SUCCESS", "WARNING", "ERROR") else "INFO"
 
+        # Buffer and flush on a short timer, so bursts of messages cost one
+        # round of Tk calls instead of four per line
+        with self._log_lock:
+            self._log_buffer.append((log_entry, tag))
+            self._history.append(log_entry)
+            if self._flush_after_id is not None:
+                return
+            self._flush_after_id = self.after(self.FLUSH_DELAY_MS, self._flush_logs)
+
+    def _flush_logs(self) -> None:
+        """Write all buffered log lines to the textbox."""
+        with self._log_lock:
+            self._flush_after_id = None
+            if not self._log_buffer:
+                return
+            entries = list(self._log_buffer)
+            self._log_buffer.clear()
+
+        # Tk's insert takes alternating text/tag arguments; merge runs of the
+        # same tag so one call covers the whole batch
+        args: list[str] = []
+        new_lines = 0
+        for text, tag in entries:
+            new_lines += text.count("\n")
+            if args and args[-1] == tag:
+                args[-2] += text
+            else:
+                args += (text, tag)
+
         # Make textbox temporarily editable
         self.textbox.configure(state="normal")
+        self._inner_text.insert("end", *args)
 
-        # Insert with color tag
-        self._inner_text.insert("end", log_entry, tag)
+        # Keep the text widget bounded so inserts and scrolling stay cheap
+        self._line_count += new_lines
+        if self._line_count > self.MAX_LINES:
+            excess = self._line_count - self.MAX_LINES
+            self._inner_text.delete("1.0", f"{excess + 1}.0")
+            self._line_count = self.MAX_LINES
 
         # Auto-scroll to bottom
         self.textbox.see("end")
@@ -177,17 +236,33 @@ class DiagnosticsPane(ctk.CTkFrame):
         # Make read-only again
         self.textbox.configure(state="disabled")
 
+    def destroy(self) -> None:
+        """Cancel a pending log flush before the widget goes away."""
+        with self._log_lock:
+            if self._flush_after_id is not None:
+                self.after_cancel(self._flush_after_id)
+                self._flush_after_id = None
+        if self._export_poll_id is not None:
+            self.after_cancel(self._export_poll_id)
+            self._export_poll_id = None
+        super().destroy()
+
     def clear_logs(self) -> None:
         """Clear all logs from textbox."""
+        with self._log_lock:
+            self._log_buffer.clear()
+            self._history.clear()
+        self._line_count = 0
         self.textbox.configure(state="normal")
         self.textbox.delete("0.0", "end")
         self.textbox.configure(state="disabled")
         self.log("Logs cleared")
 
     def _export_logs(self) -> None:
-        """Export logs to file."""
-        content = self.textbox.get("0.0", "end").strip()
-        if not content:
+        """Export logs to file (written on a background thread)."""
+        with self._log_lock:
+            has_logs = bool(self._history)
+        if not has_logs:
             self.log("No logs to export", "WARNING")
             return
 
@@ -212,17 +287,58 @@ class DiagnosticsPane(ctk.CTkFrame):
         if not filepath:
             return  # User cancelled
 
+        # Snapshot the entries (references only) and write them off the UI thread
+        with self._log_lock:
+            entries = list(self._history)
+        threading.Thread(
+            target=self._write_export, args=(Path(filepath), entries), daemon=True
+        ).start()
+        self._exports_pending += 1
+        if self._export_poll_id is None:
+            self._export_poll_id = self.after(self.EXPORT_POLL_MS, self._poll_exports)
+
+    def _poll_exports(self) -> None:
+        """Log the results of finished exports (UI thread)."""
+        self._export_poll_id = None
+        while True:
+            try:
+                message, level = self._export_results.get_nowait()
+            except queue.Empty:
+                break
+            self._exports_pending -= 1
+            self.log(message, level)
+        if self._exports_pending > 0:
+            self._export_poll_id = self.after(self.EXPORT_POLL_MS, self._poll_exports)
+
+    def _write_export(self, target: Path, entries: list[str]) -> None:
+        """
+        Write log entries to a file via a temporary file (background thread).
+
+        Args:
+            target: Destination chosen by the user
+            entries: Log entries to write
+        """
+        tmp_path = target.with_name(target.name + ".tmp")
         try:
-            Path(filepath).write_text(content, encoding="utf-8")
-            self.log(f"Logs exported to: {filepath}", "SUCCESS")
+            with tmp_path.open("w", encoding="utf-8", buffering=65536) as f:
+                f.writelines(entries)
+            tmp_path.replace(target)
         except Exception as e:
-            self.log(f"Failed to export logs: {e}", "ERROR")
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+            message, level = f"Failed to export logs: {e}", "ERROR"
+        else:
+            message, level = f"Logs exported to: {target}", "SUCCESS"
+
+        # Hand the result to the UI thread; no Tk calls from this thread
+        self._export_results.put((message, level))
 
     def get_logs(self) -> str:
         """
-        Get all log content.
+        Get retained log content (the last MAX_LINES entries, including unflushed ones).
 
         Returns:
-            All log text
+            Log text
         """
-        return self.textbox.get("0.0", "end")
+        with self._log_lock:
+            return "".join(self._history)
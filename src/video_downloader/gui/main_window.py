@@ -6,7 +6,6 @@ Provides GUI for video downloading with progress tracking and diagnostics.
 
 import logging
 import os
-import queue
 import subprocess
 import threading
 from pathlib import Path
@@ -16,12 +15,17 @@ from typing import Any
 import customtkinter as ctk
 
 from video_downloader.core.download_manager import ThreadedDownloadManager
-from video_downloader.core.runtime_manager import RuntimeManager
+from video_downloader.core.runtime_manager import get_runtime_manager
 from video_downloader.gui.diagnostics_pane import DiagnosticsPane
 from video_downloader.gui.widgets import URLEntry
-from video_downloader.utils.config import AppConfig
+from video_downloader.utils.config import AppConfig, get_default_max_concurrent
+from video_downloader.utils.constants import (
+    AUDIO_FORMATS,
+    QUEUE_POLL_ACTIVE_MS,
+    QUEUE_POLL_IDLE_MS,
+)
 from video_downloader.utils.exceptions import RuntimeNotFoundError, ValidationError
-from video_downloader.utils.ffmpeg_manager import FFmpegManager
+from video_downloader.utils.ffmpeg_manager import get_ffmpeg_manager
 from video_downloader.utils.validators import URLValidator
 
 logger = logging.getLogger(__name__)
@@ -50,8 +54,8 @@ class MainWindow(ctk.CTk):
 
         # Initialize managers
         try:
-            self.runtime_manager = RuntimeManager()
-            self.ffmpeg_manager = FFmpegManager()
+            self.runtime_manager = get_runtime_manager()
+            self.ffmpeg_manager = get_ffmpeg_manager()
         except RuntimeNotFoundError as e:
             logger.error(f"Runtime initialization failed: {e}")
             # Will show error in diagnostics pane
@@ -74,7 +78,8 @@ class MainWindow(ctk.CTk):
         self._create_widgets()
 
         # Start queue monitor
-        self.after(100, self._process_queue)
+        self._queue_after_id: str | None = None
+        self._schedule_queue_poll(QUEUE_POLL_IDLE_MS)
 
         # Log system info
         self._log_system_info()
@@ -278,7 +283,7 @@ class MainWindow(ctk.CTk):
 
         # Determine quality
         quality = self.quality_var.get()
-        audio_only = quality in ["mp3", "wav", "flac", "aac", "opus", "audio"]
+        audio_only = quality in AUDIO_FORMATS
 
         # Let yt-dlp handle filename sanitization - just pass the directory
         output_path = self.output_path
@@ -291,6 +296,7 @@ class MainWindow(ctk.CTk):
         self.diagnostics.log(f"Starting download: {url}")
 
         self.download_manager.download_in_thread(url, output_path, quality, audio_only)
+        self._wake_queue()
 
     def _open_output_folder(self) -> None:
         """Open the downloaded file's location in Windows Explorer."""
@@ -327,20 +333,14 @@ class MainWindow(ctk.CTk):
             self.diagnostics.log(data)
 
         elif event_type == "progress":
-            if "percentage" in data:
-                # Parse percentage string (e.g., "45.3%")
-                try:
-                    pct_str = data["percentage"].strip("%")
-                    pct = float(pct_str) / 100
-                    self.progress_bar.set(pct)
-
-                    speed = data.get("speed", "N/A")
-                    eta = data.get("eta", "N/A")
-                    self.progress_label.configure(
-                        text=f"Downloading: {data['percentage']} | Speed: {speed} | ETA: {eta}"
-                    )
-                except ValueError:
-                    pass
+            # The progress hook already supplies a clamped numeric fraction
+            fraction = data.get("fraction")
+            if fraction is not None:
+                self.progress_bar.set(fraction)
+                self.progress_label.configure(
+                    text=f"Downloading: {fraction:.1%} | Speed: {data.get('speed', 'N/A')} "
+                    f"| ETA: {data.get('eta', 'N/A')}"
+                )
 
         elif event_type == "complete":
             self.progress_bar.set(1.0)
@@ -356,24 +356,47 @@ class MainWindow(ctk.CTk):
             self.download_btn.configure(state="normal")
             self.cancel_btn.configure(state="disabled", fg_color="gray")
 
+    def _schedule_queue_poll(self, delay_ms: int) -> None:
+        """
+        Schedule the next queue check.
+
+        Args:
+            delay_ms: Delay before the check in milliseconds
+        """
+        self._queue_after_id = self.after(delay_ms, self._process_queue)
+
+    def _wake_queue(self) -> None:
+        """
+        Check the queue right away instead of waiting for the idle watchdog.
+
+        Called on the GUI thread when work is submitted. Workers never touch
+        Tk themselves: a worker blocked on a Tk call while destroy() waits
+        for it to finish would deadlock.
+        """
+        if self._queue_after_id is not None:
+            self.after_cancel(self._queue_after_id)
+        self._schedule_queue_poll(0)
+
     def _process_queue(self) -> None:
         """Process messages from worker threads (called periodically)."""
+        self._queue_after_id = None
         if not self.download_manager:
-            self.after(100, self._process_queue)
+            self._schedule_queue_poll(QUEUE_POLL_IDLE_MS)
             return
         try:
-            while True:
-                event_type, data = self.download_manager.message_queue.get_nowait()
+            for event_type, data in self.download_manager.drain():
                 self._handle_download_event(event_type, data)
-        except queue.Empty:
-            pass
         finally:
-            # Schedule next check
-            if not self.download_manager or not self.download_manager.shutdown_event.is_set():
-                self.after(100, self._process_queue)
+            # Schedule next check: poll quickly only while there is work
+            if not self.download_manager.shutdown_event.is_set():
+                busy = self.download_manager.is_busy()
+                self._schedule_queue_poll(QUEUE_POLL_ACTIVE_MS if busy else QUEUE_POLL_IDLE_MS)
 
     def destroy(self) -> None:
         """Clean shutdown."""
+        if self._queue_after_id is not None:
+            self.after_cancel(self._queue_after_id)
+            self._queue_after_id = None
         if self.download_manager:
             self.download_manager.shutdown()
         super().destroy()
@@ -415,7 +438,7 @@ def main() -> None:
             version="2.2.0",
             download=DownloadConfig(
                 output_dir=Path("downloads"),
-                max_concurrent=3,
+                max_concurrent=get_default_max_concurrent(),
                 timeout=300,
                 retry_attempts=3,
                 quality="native",
@@ -7,6 +7,9 @@ import tkinter as tk
 
 import customtkinter as ctk
 
+# Strict URL check for clipboard content (scheme plus URL-safe characters)
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+', re.IGNORECASE | re.ASCII)
+
 
 class URLEntry(ctk.CTkEntry):
     """
@@ -18,17 +21,24 @@ class URLEntry(ctk.CTkEntry):
     - Placeholder text support (inherited from CTkEntry)
     """
 
-    # Pattern to validate URLs
-    URL_PATTERN = re.compile(
-        r"^https?://"  # http:// or https://
-        r'[^\s<>"{}|\\^`\[\]]+'  # valid URL characters
-        r"$",
-        re.IGNORECASE,
-    )
+    # Pattern to validate URLs (use with fullmatch)
+    URL_PATTERN = _URL_RE
+    _url_match = _URL_RE.fullmatch
+
+    # Context menu entry indices (separators count as entries)
+    _MENU_CUT = 0
+    _MENU_COPY = 1
+    _MENU_PASTE = 2
+    _MENU_PASTE_URL = 4
+    _MENU_SELECT_ALL = 6
+    _MENU_CLEAR = 7
 
     def __init__(self, master: ctk.CTk, **kwargs) -> None:
         super().__init__(master, **kwargs)
 
+        self._menu: tk.Menu | None = None
+        self._clipboard_url = ""
+
         # Bind right-click event
         self.bind("<Button-3>", self._show_context_menu)
         # Also bind for macOS
@@ -37,66 +47,58 @@ class URLEntry(ctk.CTkEntry):
         self.bind("<Control-v>", self._paste_from_clipboard)
         self.bind("<Control-V>", self._paste_from_clipboard)
 
+    def _build_context_menu(self) -> tk.Menu:
+        """
+        Create the right-click menu once; entry states are updated per popup.
+
+        Returns:
+            The context menu
+        """
+        menu = tk.Menu(self, tearoff=0)
+        menu.add_command(label="Cut", command=self._cut)
+        menu.add_command(label="Copy", command=self._copy)
+        menu.add_command(label="Paste", command=self._paste_from_clipboard)
+        menu.add_separator()
+        # Smart Paste URL (validates URL format)
+        menu.add_command(label="Paste URL", command=lambda: self._paste_url(self._clipboard_url))
+        menu.add_separator()
+        menu.add_command(label="Select All", command=self._select_all)
+        menu.add_command(label="Clear", command=self._clear)
+        return menu
+
     def _show_context_menu(self, event: tk.Event) -> None:
         """Display right-click context menu."""
-        menu = tk.Menu(self, tearoff=0)
+        if self._menu is None:
+            self._menu = self._build_context_menu()
+        menu = self._menu
 
-        # Get clipboard content for smart paste
+        # Read the clipboard once for both Paste and smart paste
         try:
             clipboard = self.clipboard_get()
         except tk.TclError:
             clipboard = ""
 
-        is_valid_url = bool(self.URL_PATTERN.match(clipboard.strip()))
-
-        # Check if there's a selection
-        try:
-            has_selection = bool(self.selection_get())
-        except tk.TclError:
-            has_selection = False
-
-        has_content = bool(self.get())
-
-        # Cut
-        menu.add_command(
-            label="Cut", command=self._cut, state="normal" if has_selection else "disabled"
-        )
-
-        # Copy
-        menu.add_command(
-            label="Copy", command=self._copy, state="normal" if has_selection else "disabled"
-        )
-
-        # Paste
-        menu.add_command(
-            label="Paste",
-            command=self._paste_from_clipboard,
-            state="normal" if clipboard else "disabled",
-        )
-
-        menu.add_separator()
-
-        # Smart Paste URL (validates URL format)
-        paste_url_label = "Paste URL" if is_valid_url else "Paste URL (invalid)"
-        menu.add_command(
-            label=paste_url_label,
-            command=lambda: self._paste_url(clipboard.strip()),
-            state="normal" if is_valid_url else "disabled",
+        self._clipboard_url = clipboard.strip()
+        is_valid_url = (
+            bool(self._clipboard_url) and self._url_match(self._clipboard_url) is not None
         )
 
-        menu.add_separator()
+        has_selection = bool(self.select_present())
+        has_content = bool(self.get())
 
-        # Select All
-        menu.add_command(
-            label="Select All",
-            command=self._select_all,
-            state="normal" if has_content else "disabled",
-        )
+        def state(enabled: bool) -> str:
+            return "normal" if enabled else "disabled"
 
-        # Clear
-        menu.add_command(
-            label="Clear", command=self._clear, state="normal" if has_content else "disabled"
+        menu.entryconfigure(self._MENU_CUT, state=state(has_selection))
+        menu.entryconfigure(self._MENU_COPY, state=state(has_selection))
+        menu.entryconfigure(self._MENU_PASTE, state=state(bool(clipboard)))
+        menu.entryconfigure(
+            self._MENU_PASTE_URL,
+            label="Paste URL" if is_valid_url else "Paste URL (invalid)",
+            state=state(is_valid_url),
         )
+        menu.entryconfigure(self._MENU_SELECT_ALL, state=state(has_content))
+        menu.entryconfigure(self._MENU_CLEAR, state=state(has_content))
 
         # Show menu at cursor position
         try:
@@ -5,16 +5,26 @@ Optional feature - gracefully handles missing dependencies.
 """
 
 import importlib.util
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from video_downloader.transcription.whisper_backend import TranscriptionService
 
 WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
 
+_MISSING_WHISPER_MSG = (
+    "Transcription requires faster-whisper. Install with: pip install faster-whisper"
+)
+
 
 def is_transcription_available() -> bool:
     """Check if transcription dependencies are installed."""
     return WHISPER_AVAILABLE
 
 
-def get_transcription_service():
+def get_transcription_service() -> "type[TranscriptionService]":
     """
     Get transcription service class.
 
@@ -25,17 +35,40 @@ def get_transcription_service():
         ImportError: If faster-whisper is not installed
     """
     if not WHISPER_AVAILABLE:
-        raise ImportError(
-            "Transcription requires faster-whisper. Install with: pip install faster-whisper"
-        )
+        raise ImportError(_MISSING_WHISPER_MSG)
 
     from video_downloader.transcription.whisper_backend import TranscriptionService
 
     return TranscriptionService
 
 
+def load_transcription_service_async(
+    preset: str = "balanced", cpu_threads: int = 8
+) -> "Future[TranscriptionService]":
+    """
+    Load a transcription service without blocking the caller.
+
+    Args:
+        preset: Quality preset (fast, balanced, accurate)
+        cpu_threads: Number of CPU threads to use
+
+    Returns:
+        Future resolving to a TranscriptionService
+
+    Raises:
+        ImportError: If faster-whisper is not installed
+    """
+    if not WHISPER_AVAILABLE:
+        raise ImportError(_MISSING_WHISPER_MSG)
+
+    from video_downloader.transcription.whisper_backend import load_async
+
+    return load_async(preset, cpu_threads)
+
+
 __all__ = [
     "is_transcription_available",
     "get_transcription_service",
+    "load_transcription_service_async",
     "WHISPER_AVAILABLE",
 ]
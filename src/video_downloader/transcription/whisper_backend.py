@@ -4,19 +4,39 @@ Whisper-based transcription backend.
 Uses faster-whisper for CPU-optimized local transcription.
 """
 
+import hashlib
+import json
 import logging
+import time
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from faster_whisper import WhisperModel
 
-from video_downloader.utils.constants import TRANSCRIPTION_PRESETS
+from video_downloader.utils.constants import (
+    PROGRESS_UPDATE_INTERVAL,
+    TRANSCRIPT_CACHE_MAX_ENTRIES,
+    TRANSCRIPTION_PRESETS,
+)
+from video_downloader.utils.path_utils import ensure_dir
 
 logger = logging.getLogger(__name__)
 
+# Model loads take seconds (disk I/O + CTranslate2 init); one at a time is enough
+_load_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-load")
 
-@dataclass
+# Subtitle cue templates and the write buffer used when streaming them to disk
+_SRT_CUE = "{}\n{} --> {}\n{}\n".format
+_VTT_CUE = "\n\n{} --> {}\n{}".format
+_WRITE_BUFFER = 1 << 16
+
+# Bytes hashed from each end of an audio file to fingerprint it for the cache
+_FINGERPRINT_CHUNK = 1 << 20
+
+
+@dataclass(slots=True)
 class TranscriptSegment:
     """Single segment of transcription."""
 
@@ -25,7 +45,7 @@ class TranscriptSegment:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptResult:
     """Complete transcription result."""
 
@@ -33,11 +53,14 @@ class TranscriptResult:
     language_probability: float
     duration: float
     segments: list[TranscriptSegment] = field(default_factory=list)
+    _full_text: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def full_text(self) -> str:
-        """Get concatenated text from all segments."""
-        return " ".join(seg.text for seg in self.segments)
+        """Get concatenated text from all segments (computed on first access)."""
+        if self._full_text is None:
+            self._full_text = " ".join([seg.text for seg in self.segments])
+        return self._full_text
 
 
 class TranscriptionService:
@@ -54,6 +77,8 @@ class TranscriptionService:
         self,
         preset: str = "balanced",
         cpu_threads: int = 8,
+        cache_dir: Path | None = None,
+        cache_size: int = TRANSCRIPT_CACHE_MAX_ENTRIES,
     ) -> None:
         """
         Initialize transcription service.
@@ -61,6 +86,9 @@ class TranscriptionService:
         Args:
             preset: Quality preset (fast, balanced, accurate)
             cpu_threads: Number of CPU threads to use
+            cache_dir: Directory for cached transcripts
+                (default: ~/.video_downloader/transcripts)
+            cache_size: Maximum number of cached transcripts (0 disables the cache)
         """
         model_name, compute_type, beam_size = TRANSCRIPTION_PRESETS.get(
             preset, TRANSCRIPTION_PRESETS["balanced"]
@@ -76,22 +104,40 @@ class TranscriptionService:
         )
         self.beam_size = beam_size
         self.preset = preset
+        self.cache_dir = cache_dir or Path.home() / ".video_downloader" / "transcripts"
+        self.cache_size = cache_size
+        # Everything besides the audio that changes the transcription output
+        self._cache_tag = f"{model_name}:{compute_type}:{beam_size}"
 
     def transcribe(
         self,
         audio_path: Path,
         progress_callback: Callable[[float], None] | None = None,
+        force_refresh: bool = False,
     ) -> TranscriptResult:
         """
         Transcribe audio file to text.
 
+        Results are cached on disk by audio fingerprint and model settings,
+        so transcribing the same file again skips the model entirely.
+
         Args:
             audio_path: Path to audio file (any format FFmpeg supports)
             progress_callback: Optional callback with progress 0.0-1.0
+            force_refresh: Ignore any cached transcript for this audio
 
         Returns:
             TranscriptResult with segments and metadata
         """
+        cache_path = self._cache_path(audio_path)
+        if cache_path is not None and not force_refresh:
+            cached = self._load_cached_result(cache_path)
+            if cached is not None:
+                logger.info(f"Using cached transcript for {audio_path}")
+                if progress_callback:
+                    progress_callback(1.0)
+                return cached
+
         logger.info(f"Transcribing: {audio_path}")
 
         segments_iter, info = self.model.transcribe(
@@ -103,10 +149,15 @@ class TranscriptionService:
             },
         )
 
-        # Collect segments with progress
-        segments = []
+        # Collect segments with progress; callbacks are capped like download
+        # progress, with the latest value always delivered at the end
+        segments: list[TranscriptSegment] = []
+        append = segments.append
+        report = info.duration > 0
+        last_report = 0.0
+        pending: float | None = None
         for segment in segments_iter:
-            segments.append(
+            append(
                 TranscriptSegment(
                     start=segment.start,
                     end=segment.end,
@@ -114,18 +165,112 @@ class TranscriptionService:
                 )
             )
 
-            if progress_callback and info.duration > 0:
-                progress = min(segment.end / info.duration, 1.0)
-                progress_callback(progress)
+            if report and progress_callback is not None:
+                pending = min(segment.end / info.duration, 1.0)
+                now = time.monotonic()
+                if now - last_report >= PROGRESS_UPDATE_INTERVAL:
+                    last_report = now
+                    progress_callback(pending)
+                    pending = None
+
+        if pending is not None and progress_callback is not None:
+            progress_callback(pending)
 
         logger.info(f"Transcription complete: {len(segments)} segments")
 
-        return TranscriptResult(
+        result = TranscriptResult(
             language=info.language,
             language_probability=info.language_probability,
             duration=info.duration,
             segments=segments,
         )
+        if cache_path is not None:
+            self._save_cached_result(cache_path, result)
+        return result
+
+    def _cache_path(self, audio_path: Path) -> Path | None:
+        """
+        Path of the cached transcript for an audio file.
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            Cache file path, or None if caching is disabled or the audio
+            could not be fingerprinted
+        """
+        if self.cache_size <= 0:
+            return None
+        try:
+            fingerprint = _audio_fingerprint(audio_path)
+        except OSError as e:
+            logger.debug(f"Not caching transcript for {audio_path}: {e}")
+            return None
+        key = hashlib.blake2b(f"{fingerprint}:{self._cache_tag}".encode(), digest_size=20)
+        return self.cache_dir / f"{key.hexdigest()}.json"
+
+    def _load_cached_result(self, path: Path) -> TranscriptResult | None:
+        """
+        Load a transcript cached by a previous run.
+
+        Args:
+            path: Cache file path
+
+        Returns:
+            TranscriptResult, or None if missing or unreadable
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            data["segments"] = [TranscriptSegment(*seg) for seg in data["segments"]]
+            result = TranscriptResult(**data)
+            # Mark as recently used so pruning evicts other entries first
+            path.touch()
+            return result
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.debug(f"Ignoring unreadable transcript cache {path}: {e}")
+            return None
+
+    def _save_cached_result(self, path: Path, result: TranscriptResult) -> None:
+        """
+        Cache a transcript on disk.
+
+        Args:
+            path: Cache file path
+            result: Freshly computed transcript
+        """
+        data = {
+            "language": result.language,
+            "language_probability": result.language_probability,
+            "duration": result.duration,
+            "segments": [[seg.start, seg.end, seg.text] for seg in result.segments],
+        }
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            ensure_dir(self.cache_dir)
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            # Atomic swap so a concurrent reader never sees a partial file
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.debug(f"Could not cache transcript: {e}")
+            return
+        self._prune_cache()
+
+    def _prune_cache(self) -> None:
+        """Delete the least recently used transcripts beyond cache_size."""
+        try:
+            entries = [(p.stat().st_mtime, p) for p in self.cache_dir.glob("*.json")]
+        except OSError as e:
+            logger.debug(f"Could not list transcript cache: {e}")
+            return
+        if len(entries) <= self.cache_size:
+            return
+        entries.sort()
+        for _, stale in entries[: len(entries) - self.cache_size]:
+            try:
+                stale.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug(f"Could not evict cached transcript {stale}: {e}")
 
     def save_transcript(
         self,
@@ -144,47 +289,102 @@ class TranscriptionService:
         Returns:
             Path to saved file
         """
+        if format not in ("txt", "srt", "vtt"):
+            raise ValueError(f"Unknown format: {format}")
+
         output_path = output_path.with_suffix(f".{format}")
 
         if format == "txt":
-            content = result.full_text
-
-        elif format == "srt":
-            lines = []
-            for i, seg in enumerate(result.segments, 1):
-                start = self._format_timestamp_srt(seg.start)
-                end = self._format_timestamp_srt(seg.end)
-                lines.append(f"{i}\n{start} --> {end}\n{seg.text}\n")
-            content = "\n".join(lines)
-
-        elif format == "vtt":
-            lines = ["WEBVTT\n"]
-            for seg in result.segments:
-                start = self._format_timestamp_vtt(seg.start)
-                end = self._format_timestamp_vtt(seg.end)
-                lines.append(f"\n{start} --> {end}\n{seg.text}")
-            content = "\n".join(lines)
+            output_path.write_text(result.full_text, encoding="utf-8")
 
         else:
-            raise ValueError(f"Unknown format: {format}")
+            # Stream cue by cue so long transcripts never exist as one string
+            with output_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+                write = f.write
+                if format == "srt":
+                    fmt_ts = self._format_timestamp_srt
+                    for i, seg in enumerate(result.segments, 1):
+                        if i > 1:
+                            write("\n")
+                        write(_SRT_CUE(i, fmt_ts(seg.start), fmt_ts(seg.end), seg.text))
+                else:
+                    fmt_ts = self._format_timestamp_vtt
+                    write("WEBVTT\n")
+                    for seg in result.segments:
+                        write(_VTT_CUE(fmt_ts(seg.start), fmt_ts(seg.end), seg.text))
 
-        output_path.write_text(content, encoding="utf-8")
         logger.info(f"Saved transcript: {output_path}")
 
         return output_path
 
     def _format_timestamp_srt(self, seconds: float) -> str:
         """Format timestamp for SRT (HH:MM:SS,mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
+        hours, minutes, secs, millis = _split_seconds(seconds)
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
     def _format_timestamp_vtt(self, seconds: float) -> str:
         """Format timestamp for VTT (HH:MM:SS.mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
+        hours, minutes, secs, millis = _split_seconds(seconds)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+
+
+def _audio_fingerprint(audio_path: Path) -> str:
+    """
+    Fingerprint an audio file from its size and first and last megabyte.
+
+    Hashing stays cheap for long recordings; any re-encode or trim changes
+    the size or the sampled bytes.
+
+    Args:
+        audio_path: Path to audio file
+
+    Returns:
+        Hex digest identifying the file contents
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with audio_path.open("rb") as f:
+        size = f.seek(0, 2)
+        digest.update(str(size).encode())
+        f.seek(0)
+        digest.update(f.read(_FINGERPRINT_CHUNK))
+        if size > 2 * _FINGERPRINT_CHUNK:
+            f.seek(-_FINGERPRINT_CHUNK, 2)
+        digest.update(f.read(_FINGERPRINT_CHUNK))
+    return digest.hexdigest()
+
+
+def _split_seconds(seconds: float) -> tuple[int, int, int, int]:
+    """
+    Split a timestamp into whole hours, minutes, seconds and milliseconds.
+
+    Args:
+        seconds: Timestamp in seconds
+
+    Returns:
+        (hours, minutes, seconds, milliseconds)
+    """
+    secs, millis = divmod(int(seconds * 1000), 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    return hours, minutes, secs, millis
+
+
+def load_async(preset: str = "balanced", cpu_threads: int = 8) -> "Future[TranscriptionService]":
+    """
+    Create a TranscriptionService on a background thread.
+
+    Lets a GUI show a loading state instead of freezing during the model load.
+    Tk callers should hop back to the main loop from the done callback, e.g.
+    ``fut.add_done_callback(lambda f: root.after(0, on_ready, f))``.
+
+    Args:
+        preset: Quality preset (fast, balanced, accurate)
+        cpu_threads: Number of CPU threads to use
+
+    Returns:
+        Future resolving to the loaded service (or the load error)
+    """
+    return _load_executor.submit(TranscriptionService, preset, cpu_threads)
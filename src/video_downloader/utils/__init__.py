@@ -20,7 +20,7 @@ from video_downloader.utils.exceptions import (
     ValidationError,
     VideoDownloaderError,
 )
-from video_downloader.utils.ffmpeg_manager import FFmpegManager
+from video_downloader.utils.ffmpeg_manager import FFmpegManager, get_ffmpeg_manager
 from video_downloader.utils.path_utils import (
     get_application_path,
     get_bin_path,
@@ -49,6 +49,7 @@ __all__ = [
     "DEFAULT_OUTPUT_DIR",
     # FFmpeg
     "FFmpegManager",
+    "get_ffmpeg_manager",
     # Validators
     "URLValidator",
     "PathValidator",
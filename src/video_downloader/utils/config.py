@@ -4,12 +4,15 @@ Configuration management using TOML.
 Provides type-safe configuration loading with defaults.
 """
 
+import os
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from video_downloader.utils.constants import DEFAULT_MAX_CONCURRENT, MAX_CONCURRENT_ENV_VAR
 from video_downloader.utils.exceptions import ConfigurationError
+from video_downloader.utils.path_utils import ensure_dir
 from video_downloader.utils.user_dirs import get_downloads_folder
 
 
@@ -26,6 +29,28 @@ def get_default_downloads_folder() -> Path:
     return get_downloads_folder()
 
 
+def get_default_max_concurrent() -> int:
+    """Get the default number of concurrent downloads for this host.
+
+    Honours the VIDEO_DOWNLOADER_MAX_CONCURRENT environment variable when it
+    holds a positive integer; otherwise caps DEFAULT_MAX_CONCURRENT at the
+    number of CPUs this process may run on, so small containers are not
+    oversubscribed.
+
+    Returns:
+        Default max_concurrent value (at least 1).
+    """
+    env_value = os.environ.get(MAX_CONCURRENT_ENV_VAR, "").strip()
+    if env_value.isdigit() and int(env_value) >= 1:
+        return int(env_value)
+
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return max(1, min(DEFAULT_MAX_CONCURRENT, cpus))
+
+
 @dataclass
 class DownloadConfig:
     """Download-specific configuration."""
@@ -55,7 +80,7 @@ class DownloadConfig:
             self.output_dir = Path(output_str).expanduser()
 
         # Ensure output directory exists
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.output_dir)
 
 
 @dataclass
@@ -112,7 +137,9 @@ class AppConfig:
                 version=app_data.get("version", "2.1.0"),
                 download=DownloadConfig(
                     output_dir=Path(download_data.get("output_dir", "downloads")),
-                    max_concurrent=download_data.get("max_concurrent", 3),
+                    max_concurrent=download_data.get(
+                        "max_concurrent", get_default_max_concurrent()
+                    ),
                     timeout=download_data.get("timeout", 300),
                     retry_attempts=download_data.get("retry_attempts", 3),
                     quality=download_data.get("quality", "best"),
@@ -5,6 +5,7 @@ All hardcoded values should be defined here for easy maintenance.
 """
 
 import random
+from functools import cache
 from typing import Final
 
 # Application metadata
@@ -54,8 +55,20 @@ GUI_QUALITY_OPTIONS: Final[list[str]] = [
 DEFAULT_TIMEOUT: Final[int] = 300  # seconds
 DEFAULT_RETRY_ATTEMPTS: Final[int] = 3
 DEFAULT_MAX_CONCURRENT: Final[int] = 3
+MAX_CONCURRENT_ENV_VAR: Final[str] = "VIDEO_DOWNLOADER_MAX_CONCURRENT"
 DEFAULT_OUTPUT_DIR: Final[str] = "downloads"
 
+# Minimum interval between progress UI refreshes
+PROGRESS_UPDATE_INTERVAL: Final[float] = 0.1  # seconds
+
+# GUI event queue polling: fast while downloads run; when idle only a
+# watchdog runs, since new work is started from the GUI thread itself
+QUEUE_POLL_ACTIVE_MS: Final[int] = 20
+QUEUE_POLL_IDLE_MS: Final[int] = 1000
+
+# How long extracted playlist metadata is reused from the on-disk cache
+PLAYLIST_INFO_CACHE_TTL: Final[int] = 3600  # seconds
+
 # Transcription presets
 TRANSCRIPTION_PRESETS: Final[dict[str, tuple[str, str, int]]] = {
     "fast": ("tiny.en", "int8", 1),
@@ -63,6 +76,9 @@ TRANSCRIPTION_PRESETS: Final[dict[str, tuple[str, str, int]]] = {
     "accurate": ("medium.en", "int8", 5),
 }
 
+# Transcripts kept in the on-disk cache; least recently used are evicted
+TRANSCRIPT_CACHE_MAX_ENTRIES: Final[int] = 100
+
 # External tool URLs
 DENO_DOWNLOAD_URL: Final[str] = "https://deno.com/"
 FFMPEG_DOWNLOAD_URL: Final[str] = "https://ffmpeg.org/download.html"
@@ -126,6 +142,7 @@ def get_random_user_agent() -> str:
     return random.choice(USER_AGENTS)
 
 
+@cache
 def get_matching_user_agent(browser: str) -> str:
     """
     Get a User-Agent that matches the browser being used for cookies.
@@ -9,6 +9,7 @@ import re
 import shutil
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from video_downloader.utils.exceptions import RuntimeNotFoundError
@@ -171,3 +172,17 @@ class FFmpegManager:
     def is_available(self) -> bool:
         """Check if FFmpeg is available."""
         return self.ffmpeg_path is not None and self.ffmpeg_path.exists()
+
+
+@lru_cache(maxsize=1)
+def get_ffmpeg_manager() -> FFmpegManager:
+    """
+    Get the process-wide FFmpegManager, detecting FFmpeg on first call.
+
+    Returns:
+        Shared FFmpegManager instance
+
+    Raises:
+        RuntimeNotFoundError: If FFmpeg is not found (not cached; retried next call)
+    """
+    return FFmpegManager()
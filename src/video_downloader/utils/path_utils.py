@@ -10,6 +10,9 @@ import sys
 from pathlib import Path
 from typing import Any
 
+# Directories already created (or found) by ensure_dir() in this process
+_ensured_dirs: set[Path] = set()
+
 
 def get_application_path() -> Path:
     """
@@ -96,12 +99,46 @@ def get_default_output_dir() -> Path:
     return output_dir
 
 
+def ensure_dir(path: Path) -> Path:
+    """
+    Create a directory (and parents) once per process.
+
+    Later calls for the same path skip the mkdir syscalls entirely. If the
+    directory is deleted while the process runs, call forget_dir() before
+    ensuring it again.
+
+    Args:
+        path: Directory to create
+
+    Returns:
+        The same path, for chaining
+    """
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+    return path
+
+
+def forget_dir(path: Path) -> None:
+    """
+    Drop a directory from the ensure_dir() cache.
+
+    Args:
+        path: Directory previously passed to ensure_dir()
+    """
+    _ensured_dirs.discard(path)
+
+
 def setup_environment_paths() -> None:
     """
     Configure PATH and environment for external tools.
 
-    Must be called early in application startup.
+    Must be called early in application startup. Does nothing in a frozen
+    build where the PyInstaller runtime hook has already done this.
     """
+    if getattr(sys, "_vd_hook_done", False):
+        return
+
     bin_path = get_bin_path()
 
     if bin_path.exists():
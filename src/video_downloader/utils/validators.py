@@ -7,13 +7,22 @@ Provides secure validation for URLs and file paths.
 import ipaddress
 import re
 import socket
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import urlparse
 
 from video_downloader.utils.constants import MIX_PREFIXES
 from video_downloader.utils.exceptions import ValidationError
 
+# First non-empty list= query parameter (what parse_qs would return first)
+_LIST_PARAM_RE = re.compile(r"[?&]list=([^&#]+)")
+# All Mix prefixes as one alternation; used with .match(), so anchored at the start
+_MIX_RE = re.compile(
+    "(?:" + "|".join(map(re.escape, sorted(MIX_PREFIXES, key=len, reverse=True))) + ")"
+)
 
+
+@lru_cache(maxsize=512)
 def is_mix_playlist(url: str) -> bool:
     """
     Check if URL is a YouTube Mix (Radio) playlist.
@@ -27,15 +36,13 @@ def is_mix_playlist(url: str) -> bool:
     Returns:
         True if URL is a Mix playlist
     """
-    try:
-        query = parse_qs(urlparse(url).query)
-        if "list" not in query:
-            return False
-        playlist_id = query["list"][0]
-        return any(playlist_id.startswith(prefix) for prefix in MIX_PREFIXES)
-    except Exception:
+    # Most URLs carry no playlist at all; skip the regex for them
+    if "list=" not in url:
         return False
 
+    match = _LIST_PARAM_RE.search(url)
+    return match is not None and _MIX_RE.match(match.group(1)) is not None
+
 
 class URLValidator:
     """Validates URLs with security checks."""
@@ -54,6 +61,10 @@ class URLValidator:
         r"<\s*/",  # < /path (redirect)
     ]
 
+    # Single precompiled alternation: one linear scan instead of one per pattern.
+    # None of the branches nest quantifiers, so matching cannot backtrack badly.
+    _SHELL_INJECTION_RE = re.compile("|".join(SHELL_INJECTION_PATTERNS))
+
     @classmethod
     def validate(cls, url: str) -> str:
         """
@@ -72,6 +83,31 @@ class URLValidator:
             raise ValidationError("URL cannot be empty")
 
         url = url.strip()
+        hostname = cls._check_lexical(url)
+        cls._check_resolved_addresses(hostname)
+        return url
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _check_lexical(cls, url: str) -> str:
+        """
+        Run the purely lexical checks on a stripped URL, memoizing successes.
+
+        Only the string checks are cached (a ValidationError is never stored);
+        the DNS-based check in validate() runs on every call because the
+        answer can change.
+
+        Args:
+            url: Stripped, non-empty URL string
+
+        Returns:
+            Lower-cased hostname of the URL
+
+        Raises:
+            ValidationError: If URL is invalid or contains dangerous patterns
+        """
+        if cls._SHELL_INJECTION_RE.search(url):
+            raise ValidationError("URL contains potentially dangerous patterns")
 
         try:
             parsed = urlparse(url)
@@ -87,7 +123,6 @@ class URLValidator:
             if not parsed.netloc:
                 raise ValidationError("URL must have a valid domain")
 
-            # SSRF Prevention: resolve hostname and check all IPs
             hostname = (parsed.hostname or "").lower()
             if not hostname:
                 raise ValidationError("URL must have a valid hostname")
@@ -96,24 +131,35 @@ class URLValidator:
             if "@" in (parsed.netloc or ""):
                 raise ValidationError("URLs with credentials are not allowed")
 
-            try:
-                results = socket.getaddrinfo(
-                    hostname, None, socket.AF_UNSPEC, socket.SOCK_STREAM
-                )
-                for _, _, _, _, addr in results:
-                    ip_obj = ipaddress.ip_address(addr[0])
-                    if not ip_obj.is_global:
-                        raise ValidationError("Private/local addresses are not allowed")
-            except socket.gaierror:
-                pass  # Unresolvable hostnames are OK — they'll fail at download time
+            return hostname
+
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise ValidationError(f"URL validation failed: {e}") from e
+
+    @staticmethod
+    def _check_resolved_addresses(hostname: str) -> None:
+        """
+        SSRF prevention: resolve the hostname and reject non-global addresses.
 
-            # Check for shell injection patterns in the full URL
-            for pattern in cls.SHELL_INJECTION_PATTERNS:
-                if re.search(pattern, url):
-                    raise ValidationError("URL contains potentially dangerous patterns")
+        Never cached, so a host that re-resolves to a private address (DNS
+        rebinding) is caught on the next validation.
 
-            return url
+        Args:
+            hostname: Hostname to resolve
 
+        Raises:
+            ValidationError: If any resolved address is private/local
+        """
+        try:
+            results = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
+            for _, _, _, _, addr in results:
+                ip_obj = ipaddress.ip_address(addr[0])
+                if not ip_obj.is_global:
+                    raise ValidationError("Private/local addresses are not allowed")
+        except socket.gaierror:
+            pass  # Unresolvable hostnames are OK — they'll fail at download time
         except ValidationError:
             raise
         except Exception as e:
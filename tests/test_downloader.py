@@ -4,12 +4,21 @@ Unit tests for core downloader logic.
 All tests are offline — no network access required.
 """
 
+import os
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
-from video_downloader.core.downloader import VideoDownloader
+from video_downloader.core.download_manager import ThreadedDownloadManager
+from video_downloader.core.downloader import VideoDownloader, resolve_output
+from video_downloader.core.playlist_manager import (
+    DownloadStatus,
+    PlaylistInfo,
+    PlaylistItem,
+    PlaylistManager,
+)
 from video_downloader.utils.config import AppConfig, DownloadConfig
 from video_downloader.utils.validators import is_mix_playlist
 
@@ -119,6 +128,83 @@ class TestCalculateBackoff:
         assert sum(low_delays) / len(low_delays) < sum(high_delays) / len(high_delays)
 
 
+class TestDownloadWithRetry:
+    """Tests for VideoDownloader.download_with_retry() cancellation."""
+
+    def test_cancel_during_backoff_skips_next_attempt(
+        self, downloader, tmp_path, monkeypatch
+    ):
+        import yt_dlp
+
+        import video_downloader.core.downloader as downloader_module
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(downloader, "_configure_browser_cookies", lambda opts: opts)
+        attempts = []
+
+        class FailingYDL:
+            def __init__(self, opts):
+                attempts.append(opts)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def download(self, urls):
+                raise yt_dlp.utils.DownloadError("connection timed out")
+
+        def cancel_while_sleeping(delay):
+            downloader.cancel()
+
+        monkeypatch.setattr(downloader_module.yt_dlp, "YoutubeDL", FailingYDL)
+        monkeypatch.setattr(downloader_module.time, "sleep", cancel_while_sleeping)
+
+        assert downloader.download_with_retry("https://example.com/v", tmp_path) is False
+        assert len(attempts) == 1
+
+
+class TestDownloadMany:
+    """Tests for VideoDownloader.download_many()."""
+
+    def test_single_session_for_all_urls(self, downloader, tmp_path, monkeypatch):
+        import video_downloader.core.downloader as downloader_module
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        sessions = []
+
+        class RecordingYDL:
+            def __init__(self, opts):
+                self.urls = []
+                sessions.append(self)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def download(self, urls):
+                self.urls.extend(urls)
+                return 0
+
+        detections = []
+        monkeypatch.setattr(
+            downloader, "_configure_browser_cookies", lambda opts: detections.append(1) or opts
+        )
+        monkeypatch.setattr(downloader_module.yt_dlp, "YoutubeDL", RecordingYDL)
+
+        urls = ["https://example.com/a", "https://example.com/b"]
+        assert downloader.download_many(urls, tmp_path) is True
+        assert len(sessions) == 1
+        assert sessions[0].urls == urls
+        assert len(detections) == 1
+
+    def test_empty_batch(self, downloader, tmp_path):
+        assert downloader.download_many([], tmp_path) is True
+
+
 class TestGetFormatConfig:
     """Tests for VideoDownloader._get_format_config()."""
 
@@ -164,6 +250,13 @@ class TestGetFormatConfig:
         config = downloader._get_format_config("best", audio_only=True)
         assert config["format"] == "bestaudio/best"
 
+    def test_returns_independent_copies(self, downloader):
+        first = downloader._get_format_config("mp3")
+        first["postprocessors"][0]["preferredcodec"] = "wav"
+        first["postprocessors"].clear()
+        second = downloader._get_format_config("mp3")
+        assert second["postprocessors"][0]["preferredcodec"] == "mp3"
+
 
 class TestIsMixPlaylist:
     """Tests for the shared is_mix_playlist() utility."""
@@ -190,3 +283,500 @@ class TestIsMixPlaylist:
 
     def test_malformed_url(self):
         assert is_mix_playlist("not a url at all") is False
+
+    def test_list_as_first_query_param(self):
+        assert is_mix_playlist("https://youtube.com/playlist?list=RDMMabc&index=2") is True
+
+    def test_list_substring_of_other_param(self):
+        assert is_mix_playlist("https://youtube.com/watch?v=abc&playlist=RDabc") is False
+
+    def test_empty_list_param(self):
+        assert is_mix_playlist("https://youtube.com/watch?v=abc&list=") is False
+
+
+class TestClassifyUrls:
+    """Tests for PlaylistManager.classify_urls()."""
+
+    def test_batch_matches_single_checks(self):
+        manager = PlaylistManager(MagicMock())
+        urls = [
+            "https://www.youtube.com/playlist?list=PL123",
+            "https://www.youtube.com/watch?v=abc",
+            "https://youtu.be/abc?list=PL123",
+            "https://www.youtube.com/watch?v=abc&list=RDabc",
+        ]
+        assert manager.classify_urls(urls) == [True, False, True, True]
+        assert manager.classify_urls(urls) == [manager.is_playlist_url(u) for u in urls]
+
+
+class TestDownloadPlaylist:
+    """Tests for PlaylistManager.download_playlist()."""
+
+    @pytest.fixture
+    def playlist(self):
+        items = [
+            PlaylistItem(index=i, video_id=str(i), title=f"Video {i}", url=f"https://e.com/{i}")
+            for i in range(5)
+        ]
+        return PlaylistInfo(
+            playlist_id="PL1",
+            title="My List",
+            uploader="me",
+            url="https://e.com/list",
+            total_count=len(items),
+            items=items,
+        )
+
+    def test_concurrent_downloads_complete(self, playlist, tmp_path):
+        fake = MagicMock()
+        fake.is_cancelled = False
+        fake.clone.return_value = fake
+        fake.download_item.return_value = True
+        events = []
+
+        results = PlaylistManager(MagicMock()).download_playlist(
+            playlist, tmp_path, fake, "best", events.append, max_workers=3
+        )
+
+        assert results["completed"] == 5
+        assert fake.download_item.call_count == 5
+        assert 1 <= fake.clone.call_count <= 3
+        assert all(item.status == DownloadStatus.COMPLETE for item in playlist.items)
+        assert playlist.completed_count == 5
+        assert playlist.failed_count == 0
+        assert sum(e["type"] == "playlist_item_complete" for e in events) == 5
+
+    def test_cancel_skips_remaining_items(self, playlist, tmp_path):
+        fake = MagicMock()
+        fake.is_cancelled = False
+
+        def cancel_after_first(*args):
+            fake.is_cancelled = True
+            return False
+
+        fake.download_item.side_effect = cancel_after_first
+
+        results = PlaylistManager(MagicMock()).download_playlist(
+            playlist, tmp_path, fake, "best"
+        )
+
+        assert results == {"completed": 0, "failed": 1, "skipped": 4, "total": 5}
+        assert playlist.failed_count == 1
+        fake.clone.assert_not_called()
+
+    def test_clones_share_cancellation(self, mock_runtime_manager, mock_config):
+        downloader = VideoDownloader(mock_runtime_manager, mock_config)
+        clone = downloader.clone()
+
+        assert clone is not downloader
+        downloader.cancel()
+        assert clone.is_cancelled
+        clone.reset_cancel()
+        assert not downloader.is_cancelled
+
+
+class TestPlaylistInfoCache:
+    """Tests for the on-disk playlist metadata cache."""
+
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        import video_downloader.core.playlist_manager as playlist_module
+
+        def no_network(opts):
+            raise AssertionError("extractor should not run")
+
+        monkeypatch.setattr(playlist_module.yt_dlp, "YoutubeDL", no_network)
+        return PlaylistManager(MagicMock(), cache_dir=tmp_path / "cache")
+
+    @pytest.fixture
+    def playlist(self):
+        item = PlaylistItem(index=0, video_id="a", title="A", url="https://e.com/a")
+        return PlaylistInfo(
+            playlist_id="PL1",
+            title="List",
+            uploader="me",
+            url="https://e.com/list",
+            total_count=1,
+            items=[item],
+        )
+
+    def test_cached_info_skips_extractor(self, manager, playlist):
+        playlist.items[0].status = DownloadStatus.COMPLETE
+        manager._save_cached_info(playlist)
+
+        cached = manager.extract_playlist_info(playlist.url)
+
+        assert cached.title == "List"
+        assert cached.items[0].url == "https://e.com/a"
+        assert cached.items[0].status == DownloadStatus.PENDING
+
+    def test_youtubedl_reused_across_extractions(self, tmp_path, monkeypatch):
+        import video_downloader.core.playlist_manager as playlist_module
+
+        created = []
+
+        class FakeYDL:
+            def __init__(self, opts):
+                self.closed = False
+                created.append(self)
+
+            def extract_info(self, url, download=False):
+                return {"id": "PL1", "title": "List", "entries": iter([{"id": "a"}])}
+
+            def close(self):
+                self.closed = True
+
+        monkeypatch.setattr(playlist_module.yt_dlp, "YoutubeDL", FakeYDL)
+        runtime = MagicMock()
+        runtime.get_ytdlp_options.return_value = {"js_runtimes": {"deno": {"path": "/x"}}}
+        manager = PlaylistManager(runtime, cache_dir=tmp_path)
+
+        first = manager.extract_playlist_info("https://e.com/list", force_refresh=True)
+        manager.extract_playlist_info("https://e.com/list", force_refresh=True)
+
+        assert first.total_count == 1
+        assert len(created) == 1
+        manager.shutdown()
+        assert created[0].closed
+
+    def test_concurrent_extractions_use_separate_youtubedls(self, tmp_path, monkeypatch):
+        import threading
+
+        import video_downloader.core.playlist_manager as playlist_module
+
+        created = []
+        both_inside = threading.Barrier(2, timeout=5)
+
+        class FakeYDL:
+            def __init__(self, opts):
+                self.closed = False
+                created.append(self)
+
+            def extract_info(self, url, download=False):
+                # Deadlocks (then times out) if extractions are serialized
+                both_inside.wait()
+                return {"id": "PL1", "title": "List", "entries": iter([{"id": "a"}])}
+
+            def close(self):
+                self.closed = True
+
+        monkeypatch.setattr(playlist_module.yt_dlp, "YoutubeDL", FakeYDL)
+        runtime = MagicMock()
+        runtime.get_ytdlp_options.return_value = {}
+        results = []
+
+        with PlaylistManager(runtime, cache_dir=tmp_path) as manager:
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        manager.extract_playlist_info("https://e.com/list", force_refresh=True)
+                    )
+                )
+                for _ in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert all(result is not None for result in results)
+        assert len(created) == 2
+        assert all(ydl.closed for ydl in created)
+
+    def test_stale_cache_ignored(self, manager, playlist):
+        import os
+
+        manager._save_cached_info(playlist)
+        os.utime(manager._cache_path(playlist.url), (0, 0))
+        assert manager._load_cached_info(playlist.url) is None
+
+
+class TestRuntimeVersionProbes:
+    """Tests for cached RuntimeManager version probes."""
+
+    def test_ffmpeg_version_probed_once(self, tmp_path, monkeypatch):
+        import video_downloader.core.runtime_manager as runtime_module
+        from video_downloader.core.runtime_manager import RuntimeManager
+
+        ffmpeg = tmp_path / "ffmpeg"
+        ffmpeg.touch()
+        calls = []
+
+        def fake_probe(argv, timeout=2.0):
+            calls.append(argv)
+            return "ffmpeg version 7.0"
+
+        monkeypatch.setattr(runtime_module, "_probe_first_line", fake_probe)
+        rm = RuntimeManager.__new__(RuntimeManager)
+        rm.ffmpeg_path = ffmpeg
+        rm._versions = {}
+        rm._ytdlp_opts = None
+
+        assert rm.get_ffmpeg_version() == "ffmpeg version 7.0"
+        assert rm.get_ffmpeg_version() == "ffmpeg version 7.0"
+        assert len(calls) == 1
+
+        rm.invalidate()
+        rm.get_ffmpeg_version()
+        assert len(calls) == 2
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shell")
+    def test_probe_reads_first_line(self):
+        from video_downloader.core.runtime_manager import _probe_first_line
+
+        assert _probe_first_line(["sh", "-c", "printf 'v1.2\\nmore\\n'"]) == "v1.2"
+        assert _probe_first_line(["sh", "-c", "exit 3"]) is None
+
+
+class TestWhich:
+    """Tests for the cached PATH lookup used by RuntimeManager."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX executable bits")
+    def test_first_executable_in_path_order(self, tmp_path, monkeypatch):
+        from video_downloader.core.runtime_manager import _which
+
+        first, second = tmp_path / "a", tmp_path / "b"
+        first.mkdir()
+        second.mkdir()
+        (first / "tool").write_text("")  # not executable: skipped
+        (second / "tool").write_text("")
+        (second / "tool").chmod(0o755)
+        monkeypatch.setenv("PATH", f"{first}{os.pathsep}{second}")
+
+        assert _which("tool") == second / "tool"
+        assert _which("missing") is None
+
+
+class TestDrainMessages:
+    """Tests for ThreadedDownloadManager.drain()."""
+
+    @pytest.fixture
+    def manager(self, mock_runtime_manager, mock_config):
+        mgr = ThreadedDownloadManager(mock_runtime_manager, mock_config, MagicMock())
+        yield mgr
+        mgr.executor.shutdown(wait=False)
+
+    def test_empty(self, manager):
+        assert manager.drain() == []
+
+    def test_coalesces_consecutive_progress(self, manager):
+        manager.message_queue.extend(
+            [
+                ("status", "start"),
+                ("progress", {"percentage": "10%"}),
+                ("progress", {"percentage": "20%"}),
+                ("complete", "file.mp4"),
+                ("progress", {"percentage": "30%"}),
+            ]
+        )
+        manager._msg_event.set()
+
+        assert manager.drain() == [
+            ("status", "start"),
+            ("progress", {"percentage": "20%"}),
+            ("complete", "file.mp4"),
+            ("progress", {"percentage": "30%"}),
+        ]
+        assert manager.drain() == []
+
+    def test_throttled_progress_flushes_before_other_events(self, manager):
+        manager._send_update("progress", {"percentage": "10%"})
+        manager._send_update("progress", {"percentage": "20%"})  # held back
+        manager._send_update("complete", "file.mp4")
+
+        assert manager.drain() == [
+            ("progress", {"percentage": "20%"}),
+            ("complete", "file.mp4"),
+        ]
+
+    def test_held_progress_released_after_interval(self, manager):
+        manager._send_update("progress", {"percentage": "10%"})
+        manager._send_update("progress", {"percentage": "20%"})  # held back
+        assert manager.drain() == [("progress", {"percentage": "10%"})]
+        assert manager.drain() == []  # still inside the throttle interval
+
+        manager._last_progress_signal -= 1.0  # interval has elapsed
+        assert manager.drain() == [("progress", {"percentage": "20%"})]
+        assert manager._pending_progress is None
+
+    def test_is_busy(self, manager):
+        assert not manager.is_busy()
+
+        manager._send_update("status", "Validating URL...")
+        assert manager.is_busy()
+        manager.drain()
+        assert not manager.is_busy()
+
+        with manager._lock:
+            manager._pending += 1
+        assert manager.is_busy()
+
+
+class TestResolveOutput:
+    """Tests for resolve_output()."""
+
+    def test_default_uses_config_dir(self, mock_config):
+        assert resolve_output(mock_config) == mock_config.download.output_dir
+
+    def test_directory_is_created(self, mock_config, tmp_path):
+        target = tmp_path / "nested" / "out"
+        assert resolve_output(mock_config, target) == target
+        assert target.is_dir()
+
+    def test_file_path_uses_parent(self, mock_config, tmp_path):
+        target = tmp_path / "sub" / "video.mp4"
+        assert resolve_output(mock_config, target) == target.parent
+        assert target.parent.is_dir()
+        assert not target.exists()
+
+
+class TestProgressHook:
+    """Tests for the progress info emitted by _create_progress_hook()."""
+
+    def _emit(self, downloader, status):
+        received = []
+        hook = downloader._create_progress_hook(received.append)
+        hook({"status": "downloading", **status})
+        return received[0]
+
+    def test_fraction_from_percent(self, downloader):
+        info = self._emit(downloader, {"_percent": 45.0, "_percent_str": " 45.0%"})
+        assert info["fraction"] == pytest.approx(0.45)
+        assert info["percentage"] == "45.0%"
+
+    def test_fraction_from_bytes(self, downloader):
+        info = self._emit(downloader, {"downloaded_bytes": 25, "total_bytes_estimate": 100})
+        assert info["fraction"] == pytest.approx(0.25)
+
+    def test_fraction_unknown_total(self, downloader):
+        info = self._emit(downloader, {"downloaded_bytes": 25})
+        assert info["fraction"] == 0.0
+
+
+class TestBrowserInstalled:
+    """Tests for the cached browser installation probe."""
+
+    def test_cached_until_cleared(self, downloader, tmp_path, monkeypatch):
+        profile = tmp_path / "profile"
+        monkeypatch.setitem(VideoDownloader.BROWSER_PROFILE_PATHS, "chrome", (profile,))
+        VideoDownloader.clear_browser_cache()
+
+        assert downloader._is_browser_installed("chrome") is False
+        profile.mkdir()
+        assert downloader._is_browser_installed("chrome") is False  # cached
+
+        VideoDownloader.clear_browser_cache()
+        assert downloader._is_browser_installed("chrome") is True
+
+    def test_unknown_browser_assumed_installed(self, downloader):
+        assert downloader._is_browser_installed("safari") is True
+
+
+class TestBrowserRunning:
+    """Tests for running-browser detection from the process snapshot."""
+
+    def test_uses_process_snapshot(self, downloader, monkeypatch):
+        import time
+
+        monkeypatch.setattr(
+            VideoDownloader,
+            "_process_snapshot",
+            (time.monotonic(), frozenset({"chrome", "chrome.exe"})),
+        )
+        assert downloader._is_browser_running("chrome") is True
+        assert downloader._is_browser_running("edge") is False
+        assert downloader._is_browser_running("firefox") is False
+
+
+class TestAvailableBrowsers:
+    """Tests for VideoDownloader._get_available_browsers()."""
+
+    def test_filters_and_warns_once(self, downloader, monkeypatch, caplog):
+        state = {
+            "firefox": (False, False),
+            "chrome": (True, True),
+            "edge": (True, False),
+            "safari": (True, False),
+        }
+        monkeypatch.setattr(downloader, "_collect_browser_state", lambda: state)
+        monkeypatch.setattr(VideoDownloader, "_logged_locks", set())
+
+        with caplog.at_level("WARNING"):
+            assert downloader._get_available_browsers() == ["edge", "safari"]
+            assert downloader._get_available_browsers() == ["edge", "safari"]
+
+        assert sum("locked cookies" in r.message for r in caplog.records) == 1
+
+
+class TestConfigureBrowserCookies:
+    """Tests for cookie source caching and rotation."""
+
+    @pytest.fixture
+    def detections(self, downloader, monkeypatch):
+        calls = []
+
+        def fake_available():
+            calls.append(1)
+            return ["firefox", "chrome"]
+
+        monkeypatch.setattr(downloader, "_get_available_browsers", fake_available)
+        return calls
+
+    def test_detection_reused_across_calls(self, downloader, detections):
+        first = downloader._configure_browser_cookies({})
+        second = downloader._configure_browser_cookies({})
+        assert first["cookiesfrombrowser"][0] == "firefox"
+        assert second == first
+        assert len(detections) == 1
+
+    def test_rotation_switches_to_fallback(self, downloader, detections):
+        downloader._configure_browser_cookies({})
+        downloader._rotate_cookie_source()
+        opts = downloader._configure_browser_cookies({})
+        assert opts["cookiesfrombrowser"][0] == "chrome"
+        assert downloader._selected_browser == "chrome"
+        assert len(detections) == 1
+
+    def test_rotation_without_fallback_redetects(self, downloader, detections):
+        downloader._configure_browser_cookies({})
+        downloader._rotate_cookie_source()
+        downloader._rotate_cookie_source()
+        downloader._configure_browser_cookies({})
+        assert len(detections) == 2
+
+
+class TestFindCookiesFile:
+    """Tests for VideoDownloader._find_cookies_file()."""
+
+    @pytest.fixture
+    def cookie_dirs(self, tmp_path, monkeypatch):
+        app_dir = tmp_path / "app"
+        app_dir.mkdir()
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setattr(
+            "video_downloader.utils.path_utils.get_application_path", lambda: app_dir
+        )
+        monkeypatch.setattr(
+            "video_downloader.utils.user_dirs.get_downloads_folder", lambda: tmp_path / "dl"
+        )
+        return app_dir
+
+    def test_finds_netscape_file(self, downloader, cookie_dirs):
+        cookies = cookie_dirs / "cookies.txt"
+        cookies.write_text("# Netscape HTTP Cookie File\n.example.com\tTRUE\n")
+        assert downloader._find_cookies_file() == cookies
+
+    def test_rejects_invalid_file(self, downloader, cookie_dirs):
+        (cookie_dirs / "cookies.txt").write_text("garbage\n")
+        assert downloader._find_cookies_file() is None
+
+    def test_rescans_after_change(self, downloader, cookie_dirs):
+        import os
+
+        cookies = cookie_dirs / "cookies.txt"
+        cookies.write_text("# Netscape HTTP Cookie File\n")
+        assert downloader._find_cookies_file() == cookies
+
+        cookies.write_text("garbage\n")
+        os.utime(cookies, ns=(0, 0))
+        assert downloader._find_cookies_file() is None
@@ -0,0 +1,210 @@
+"""
+Unit tests for the Whisper transcription backend.
+
+faster-whisper is optional; when it is not installed a stand-in module is
+registered so the backend can be imported. The model itself is always mocked.
+"""
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+if importlib.util.find_spec("faster_whisper") is None:
+    _stub = types.ModuleType("faster_whisper")
+    _stub.__spec__ = importlib.machinery.ModuleSpec("faster_whisper", None)
+    _stub.WhisperModel = MagicMock  # type: ignore[attr-defined]
+    sys.modules["faster_whisper"] = _stub
+
+from video_downloader.transcription import whisper_backend  # noqa: E402
+from video_downloader.transcription.whisper_backend import (  # noqa: E402
+    TranscriptionService,
+    TranscriptResult,
+    TranscriptSegment,
+    _audio_fingerprint,
+)
+
+
+def _model_output(segments, duration):
+    """Build what WhisperModel.transcribe() returns for the given segments."""
+    raw = [types.SimpleNamespace(start=s, end=e, text=f" {t} ") for s, e, t in segments]
+    info = types.SimpleNamespace(language="en", language_probability=0.9, duration=duration)
+    return iter(raw), info
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(whisper_backend, "WhisperModel", MagicMock())
+    svc = TranscriptionService("fast", cpu_threads=1, cache_dir=tmp_path / "cache")
+    svc.model.transcribe.side_effect = lambda *a, **kw: _model_output(
+        [(0.0, 1.5, "hello"), (1.5, 3.0, "world")], 3.0
+    )
+    return svc
+
+
+@pytest.fixture
+def audio(tmp_path):
+    path = tmp_path / "audio.wav"
+    path.write_bytes(b"RIFF" + bytes(range(256)) * 64)
+    return path
+
+
+class TestTranscriptCache:
+    """Tests for the on-disk transcript cache."""
+
+    def test_miss_then_hit(self, service, audio):
+        first = service.transcribe(audio)
+        progress = []
+        second = service.transcribe(audio, progress.append)
+
+        assert service.model.transcribe.call_count == 1
+        assert second == first
+        assert second.full_text == "hello world"
+        assert progress == [1.0]
+
+    def test_force_refresh_reruns_model(self, service, audio):
+        service.transcribe(audio)
+        service.transcribe(audio, force_refresh=True)
+
+        assert service.model.transcribe.call_count == 2
+
+    def test_corrupt_cache_file_is_ignored(self, service, audio):
+        service.transcribe(audio)
+        (cache_file,) = service.cache_dir.glob("*.json")
+        cache_file.write_text("{not json", encoding="utf-8")
+
+        result = service.transcribe(audio)
+
+        assert service.model.transcribe.call_count == 2
+        assert result.full_text == "hello world"
+
+    def test_changed_audio_misses(self, service, audio):
+        service.transcribe(audio)
+        audio.write_bytes(audio.read_bytes()[:-1] + b"\x00")
+        service.transcribe(audio)
+
+        assert service.model.transcribe.call_count == 2
+
+    def test_least_recently_used_entries_are_evicted(self, service, tmp_path):
+        service.cache_size = 2
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"clip{i}.wav"
+            path.write_bytes(bytes([i]) * 100)
+            paths.append(path)
+            service.transcribe(path)
+            # Distinct, increasing mtimes regardless of filesystem resolution
+            os.utime(service._cache_path(path), (i, i))
+
+        assert len(list(service.cache_dir.glob("*.json"))) == 2
+        assert not service._cache_path(paths[0]).exists()
+
+    def test_zero_size_disables_cache(self, service, audio):
+        service.cache_size = 0
+        service.transcribe(audio)
+        service.transcribe(audio)
+
+        assert service.model.transcribe.call_count == 2
+        assert not service.cache_dir.exists()
+
+
+class TestAudioFingerprint:
+    """Tests for _audio_fingerprint()."""
+
+    def test_small_file_is_hashed_whole(self, tmp_path):
+        data = bytearray(b"\x00" * (1 << 20) + b"\x01" * 1000)
+        path = tmp_path / "a.wav"
+        path.write_bytes(data)
+        before = _audio_fingerprint(path)
+
+        # A byte past the first MiB of a sub-2 MiB file still counts
+        data[(1 << 20) + 10] = 0x02
+        path.write_bytes(data)
+
+        assert _audio_fingerprint(path) != before
+
+    def test_identical_content_matches(self, tmp_path):
+        first, second = tmp_path / "a.wav", tmp_path / "b.wav"
+        first.write_bytes(b"same audio")
+        second.write_bytes(b"same audio")
+
+        assert _audio_fingerprint(first) == _audio_fingerprint(second)
+
+
+class TestSaveTranscript:
+    """Tests for TranscriptionService.save_transcript()."""
+
+    @pytest.fixture
+    def result(self):
+        return TranscriptResult(
+            language="en",
+            language_probability=1.0,
+            duration=3726.0,
+            segments=[
+                TranscriptSegment(0.0, 1.5, "hello"),
+                TranscriptSegment(3725.25, 3726.0, "world"),
+            ],
+        )
+
+    def test_srt_output(self, service, result, tmp_path):
+        path = service.save_transcript(result, tmp_path / "out", "srt")
+
+        assert path.read_text(encoding="utf-8") == (
+            "1\n00:00:00,000 --> 00:00:01,500\nhello\n\n2\n01:02:05,250 --> 01:02:06,000\nworld\n"
+        )
+
+    def test_vtt_output(self, service, result, tmp_path):
+        path = service.save_transcript(result, tmp_path / "out", "vtt")
+
+        assert path.read_text(encoding="utf-8") == (
+            "WEBVTT\n"
+            "\n\n00:00:00.000 --> 00:00:01.500\nhello"
+            "\n\n01:02:05.250 --> 01:02:06.000\nworld"
+        )
+
+    @pytest.mark.parametrize(("fmt", "expected"), [("srt", ""), ("vtt", "WEBVTT\n"), ("txt", "")])
+    def test_empty_transcript(self, service, tmp_path, fmt, expected):
+        empty = TranscriptResult(language="en", language_probability=1.0, duration=0.0)
+        path = service.save_transcript(empty, tmp_path / "out", fmt)
+
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_unknown_format_writes_nothing(self, service, result, tmp_path):
+        with pytest.raises(ValueError):
+            service.save_transcript(result, tmp_path / "out", "doc")
+
+        assert list(tmp_path.glob("out*")) == []
+
+
+class TestTranscribeProgress:
+    """Tests for progress reporting in TranscriptionService.transcribe()."""
+
+    def test_final_progress_delivered_after_throttling(self, service, audio, monkeypatch):
+        service.cache_size = 0
+        service.model.transcribe.side_effect = lambda *a, **kw: _model_output(
+            [(i, i + 1.0, f"s{i}") for i in range(10)], 10.0
+        )
+        # Frozen clock: only the first tick passes the throttle
+        monkeypatch.setattr(whisper_backend.time, "monotonic", lambda: 1000.0)
+        progress = []
+
+        result = service.transcribe(audio, progress.append)
+
+        assert len(result.segments) == 10
+        assert progress == [0.1, 1.0]
+
+
+def test_timestamp_formatting(service):
+    assert service._format_timestamp_srt(3725.25) == "01:02:05,250"
+    assert service._format_timestamp_vtt(59.999) == "00:00:59.999"
+    assert service._format_timestamp_srt(0.0) == "00:00:00,000"
+
+
+def test_cache_path_stable_per_settings(service, audio):
+    assert service._cache_path(audio) == service._cache_path(audio)
+    assert service._cache_path(Path("missing.wav")) is None
@@ -174,6 +174,27 @@ class TestSSRFPrevention:
             )
             assert "this-domain-does-not-exist-xyz123.com" in result
 
+    def test_repeat_validation_reresolves_host(self):
+        """Lexical checks are cached, but every validation resolves the host again."""
+        URLValidator._check_lexical.cache_clear()
+        url = "https://www.youtube.com/watch?v=cached123"
+        with patch(
+            "video_downloader.utils.validators.socket.getaddrinfo",
+            return_value=self._mock_getaddrinfo("142.250.80.46"),
+        ) as mock_resolve:
+            assert URLValidator.validate(url) == url
+            assert URLValidator.validate(f"  {url}\n") == url
+            assert mock_resolve.call_count == 2
+        assert URLValidator._check_lexical.cache_info().hits == 1
+
+        # DNS rebinding: the same host now points at a private address
+        with patch(
+            "video_downloader.utils.validators.socket.getaddrinfo",
+            return_value=self._mock_getaddrinfo("127.0.0.1"),
+        ):
+            with pytest.raises(ValidationError, match="Private/local addresses"):
+                URLValidator.validate(url)
+
 
 class TestPathValidatorReservedNames:
     """Tests for reserved name validation across all path components."""